@@ -1,45 +1,137 @@
 import os
+import re
 import sys
-import subprocess
 import time
-import json
-from datetime import datetime, timedelta
-from pathlib import Path
+from functools import cache, lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, NoReturn
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from lock_me_out.utils.logging import setup_logging
-from lock_me_out.manager import LockOutManager, ScheduleManager
-from lock_me_out.settings import load_settings, settings
-from lock_me_out.utils.time import calculate_from_range, format_duration_seconds
-from lock_me_out.utils.state import write_state, cleanup_state
+if TYPE_CHECKING:
+    from subprocess import CompletedProcess
+
+    import click
+    from rich.console import Console
+    from rich.text import Text
+
+    from lock_me_out.manager import ScheduleManager
 
 
 app = typer.Typer(help="Lock Me Out - CLI Schedule Manager")
-console = Console()
+
+_APPS_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Above this many rows, `list` prints plain tab-separated output
+_PLAIN_TABLE_THRESHOLD = 200
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Returns the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _die(message: str, code: int = 1) -> NoReturn:
+    """Prints an error and exits with SystemExit, bypassing Typer's Exit handling."""
+    _console().print(f"[red]Error:[/red] {message}")
+    raise SystemExit(code)
+
+
+def _pidfd_alive(pid: int) -> bool | None:
+    """
+    Checks a process through a pidfd, which cannot be fooled by PID reuse.
+
+    Returns None when pidfds are unavailable (non-Linux or kernel < 5.3).
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
+    import select
+
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return None
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        # A pidfd becomes readable once the process has exited.
+        return not poller.poll(0)
+    finally:
+        os.close(fd)
+
+
+def _is_pid_alive(pid: int) -> bool:
+    """Checks whether a process exists, via a pidfd on Linux or signal 0 elsewhere."""
+    alive = _pidfd_alive(pid)
+    if alive is not None:
+        return alive
+    if sys.platform.startswith("linux"):
+        return os.path.exists(f"/proc/{pid}")
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+_state_cache: tuple[tuple, dict] | None = None
+
+
+def _read_state() -> dict:
+    """
+    Returns the daemon's state file contents, or {} if there is none.
+
+    The file is opened once and fstat'ed; the parse is cached against its
+    path, inode and nanosecond mtime, so commands that consult the state more
+    than once read and decode it only once. Callers must not mutate the
+    returned dict.
+    """
+    import json
+
+    from lock_me_out.settings import settings
+
+    global _state_cache
+
+    path = settings.state_file
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return {}
+    try:
+        st = os.fstat(fd)
+        key = (path, st.st_ino, st.st_mtime_ns)
+        if _state_cache is not None and _state_cache[0] == key:
+            return _state_cache[1]
+        # State files are a few hundred bytes; one read of st_size covers them
+        data = os.read(fd, st.st_size)
+    except OSError:
+        return {}
+    finally:
+        os.close(fd)
+
+    try:
+        state = json.loads(data)
+    except ValueError:
+        state = {}
+    if not isinstance(state, dict):
+        state = {}
+    _state_cache = (key, state)
+    return state
 
 
 def get_daemon_status() -> dict:
     """Checks the daemon's running status and returns active lockout info."""
     status = {"is_running": False, "active_lockout": None}
-    if not settings.state_file.exists():
-        return status
-    try:
-        with open(settings.state_file) as f:
-            state = json.load(f)
-            pid = state.get("pid")
-            active_lockout = state.get("active_lockout")
-            if pid:
-                try:
-                    os.kill(pid, 0)  # Check if process exists
-                    status["is_running"] = True
-                    status["active_lockout"] = active_lockout
-                except OSError:
-                    pass  # Process does not exist
-    except (json.JSONDecodeError, FileNotFoundError):
-        pass
+    state = _read_state()
+    pid = state.get("pid")
+    if pid and _is_pid_alive(pid):
+        status["is_running"] = True
+        status["active_lockout"] = state.get("active_lockout")
     return status
 
 
@@ -48,15 +140,134 @@ def is_daemon_running() -> bool:
     return get_daemon_status()["is_running"]
 
 
+def _wait_for_daemon(timeout: float = 5.0, interval: float = 0.05) -> bool:
+    """Waits until the daemon has written a live PID, returning early once it has."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if is_daemon_running():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
 def process_apps_list(apps: list[str] | None) -> list[str]:
     """Processes a list of strings potentially containing commas into a clean list of app names."""
     if not apps:
         return []
-    processed = []
-    for a in apps:
-        parts = [x.strip() for x in a.split(",") if x.strip()]
-        processed.extend(parts)
-    return processed
+    # One C-level split over all values; whitespace inside a name is kept
+    joined = ",".join(apps).strip()
+    return [name for name in _APPS_SPLIT_RE.split(joined) if name]
+
+
+@lru_cache(maxsize=4096)
+def _fmt_delay(delay_secs: int) -> str:
+    """Formats the time until a schedule starts (e.g. 'NOW', '45s', '2h 5m')."""
+    if delay_secs < 60:
+        return f"{delay_secs}s" if delay_secs > 0 else "NOW"
+    if delay_secs < 3600:
+        return f"{delay_secs // 60}m"
+    return f"{delay_secs // 3600}h {(delay_secs % 3600) // 60}m"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_duration(total_secs: int) -> str:
+    """Cached format_duration_seconds; schedules often share the same length."""
+    from lock_me_out.utils.time import format_duration_seconds
+
+    return format_duration_seconds(total_secs)
+
+
+_PHASE_VERB = {"WAITING": "Starts", "LOCKED": "Ends"}
+
+
+def _remaining_secs(active_lockout: dict) -> int:
+    """Seconds left in the reported phase, from its end time as of now."""
+    ends_at = active_lockout.get("ends_at")
+    if ends_at is None:
+        # Written by an older daemon
+        return active_lockout.get("remaining_secs", 0)
+    return max(0, int(ends_at - time.time()))
+
+
+@lru_cache(maxsize=4096)
+def _format_countdown(rem_secs: int, phase: str | None) -> str:
+    """Formats an active session's countdown (e.g. 'Starts in 5m', 'Ends in 30s')."""
+    verb = _PHASE_VERB.get(phase)
+    if verb is None:
+        return "N/A"
+    return f"{verb} in {rem_secs // 60}m" if rem_secs > 60 else f"{verb} in {rem_secs}s"
+
+
+_apps_str_cache: dict[tuple[str, ...], str] = {}
+
+
+def _apps_str(apps: list[str]) -> str:
+    """Joins an app list for display, reusing the result for repeated lists."""
+    if not apps:
+        return "None"
+    key = tuple(apps)
+    joined = _apps_str_cache.get(key)
+    if joined is None:
+        joined = _apps_str_cache[key] = ", ".join(key)
+    return joined
+
+
+def _send_command(command: dict, legacy: bool = False) -> bool:
+    """
+    Delivers a command to the daemon and returns whether it was accepted.
+
+    Commands go over the daemon's Unix socket; with legacy set they are
+    dropped into the command file for the daemon to pick up instead.
+    """
+    import json
+
+    from lock_me_out.settings import settings
+
+    if legacy:
+        # Write aside, then hard-link into place: the daemon never sees a
+        # partial file, and the link fails if another command is pending.
+        tmp = settings.command_file.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(json.dumps(command).encode())
+            os.link(tmp, settings.command_file)
+        except FileExistsError:
+            _console().print(
+                "[yellow]Warning:[/yellow] Another command is already pending "
+                f"(at {settings.command_file}). "
+                "Please wait a moment before trying again."
+            )
+            raise typer.Exit(1)
+        except IOError as e:
+            _die(f"Could not send command to daemon: {e}")
+        finally:
+            tmp.unlink(missing_ok=True)
+        return True
+
+    from lock_me_out.utils.ipc import send_command
+
+    try:
+        return send_command(settings.command_socket, command)
+    except (ConnectionRefusedError, FileNotFoundError):
+        _die("Daemon is not running. Please start it with `lmout start`.")
+    except OSError as e:
+        _die(f"Could not send command to daemon: {e}")
+
+
+def _notify_daemon() -> None:
+    """
+    Asks a running daemon to re-check schedules and settings right away.
+
+    An idle daemon may sleep for minutes between checks. Best effort: if no
+    daemon is listening it will read the changes when it starts.
+    """
+    from lock_me_out.settings import settings
+    from lock_me_out.utils.ipc import send_command
+
+    try:
+        send_command(settings.command_socket, {"command": "reload"}, timeout=1.0)
+    except OSError:
+        pass
 
 
 @app.command()
@@ -78,7 +289,13 @@ def add(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Add a new scheduled lockout."""
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.settings import settings
+    from lock_me_out.utils.logging import setup_logging
+    from lock_me_out.utils.time import calculate_from_range
+
     setup_logging(verbose=verbose)
+    console = _console()
     sm = ScheduleManager()
 
     processed_apps = process_apps_list(apps)
@@ -95,12 +312,11 @@ def add(
         )
         if total_duration_mins > max_allowed_mins:
             lockout_type = "full lockout" if full_lockout else "app-block"
-            console.print(
-                f"[red]Error:[/red] Scheduled {lockout_type} duration ({total_duration_mins}m) "
+            _die(
+                f"Scheduled {lockout_type} duration ({total_duration_mins}m) "
                 f"exceeds the maximum allowed ({max_allowed_mins}m). "
                 "This is a guardrail to prevent permanent lockouts."
             )
-            raise typer.Exit(1)
 
         sched = sm.add_schedule(
             start_time,
@@ -110,13 +326,13 @@ def add(
             blocked_apps=blocked_apps,
             block_only=not full_lockout,
         )
+        _notify_daemon()
         console.print(
             f"[green]Successfully added schedule:[/green] "
             f"{sched.start_time} - {sched.end_time}"
         )
     except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1) from None
+        _die(str(e))
 
 
 @app.command(name="instant")
@@ -132,36 +348,40 @@ def instant(
         False, "--full-lockout", help="Lock the entire screen, not just apps"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
+    legacy: bool = typer.Option(
+        False, "--legacy", help="Send the command via the command file, not the socket"
+    ),
 ) -> None:
     """Start an instant lockout session via the running daemon."""
+    from lock_me_out.settings import settings
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
 
-    daemon_status = get_daemon_status()
-    if not daemon_status["is_running"]:
-        console.print(
-            "[red]Error:[/red] Daemon is not running. Please start it with `lmout start`."
-        )
-        raise typer.Exit(1)
-    
-    if daemon_status["active_lockout"]:
-        console.print(
-            "[yellow]Warning:[/yellow] Cannot start instant lockout. An active lockout is already in progress."
-        )
-        raise typer.Exit(1)
+    if legacy:
+        # The socket path gets both answers from the daemon itself.
+        daemon_status = get_daemon_status()
+        if not daemon_status["is_running"]:
+            _die("Daemon is not running. Please start it with `lmout start`.")
 
-    if settings.command_file.exists():
-        # Check if the file is stale (older than 30 seconds)
-        mtime = settings.command_file.stat().st_mtime
-        if time.time() - mtime > 30:
-            console.print("[yellow]Found stale command file, removing...[/yellow]")
-            settings.command_file.unlink()
-        else:
+        if daemon_status["active_lockout"]:
             console.print(
-                f"[yellow]Warning:[/yellow] Another command is already pending (at {settings.command_file}). "
-                "Please wait a moment before trying again."
+                "[yellow]Warning:[/yellow] Cannot start instant lockout. An active lockout is already in progress."
             )
             raise typer.Exit(1)
-    
+
+        # A command file is only abandoned if no daemon holds its lock; one
+        # that a live daemon has yet to pick up is reported as pending.
+        from lock_me_out.utils.ipc import is_daemon_lock_held
+
+        if not is_daemon_lock_held(settings.daemon_lock_file):
+            try:
+                settings.command_file.unlink()
+                console.print("[yellow]Found stale command file, removing...[/yellow]")
+            except FileNotFoundError:
+                pass
+
     max_allowed_mins = (
         settings.MAX_TOTAL_LOCKOUT_MINUTES
         if full_lockout
@@ -169,12 +389,11 @@ def instant(
     )
     if duration > max_allowed_mins:
         lockout_type = "full lockout" if full_lockout else "app-block"
-        console.print(
-            f"[red]Error:[/red] Instant {lockout_type} duration ({duration}m) "
+        _die(
+            f"Instant {lockout_type} duration ({duration}m) "
             f"exceeds the maximum allowed ({max_allowed_mins}m). "
             "This is a guardrail to prevent permanent lockouts."
         )
-        raise typer.Exit(1)
 
     processed_apps = process_apps_list(apps)
     blocked_apps = processed_apps if processed_apps else settings.blocked_apps
@@ -187,12 +406,10 @@ def instant(
         "block_only": not full_lockout,
     }
 
-    try:
-        # This is an atomic operation on most OSes.
-        with open(settings.command_file, "w") as f:
-            json.dump(command, f)
-    except IOError as e:
-        console.print(f"[red]Error:[/red] Could not send command to daemon: {e}")
+    if not _send_command(command, legacy):
+        console.print(
+            "[yellow]Warning:[/yellow] Cannot start instant lockout. An active lockout is already in progress."
+        )
         raise typer.Exit(1)
 
     mode_text = "Full Lockout" if full_lockout else "App Blocking"
@@ -204,23 +421,40 @@ def instant(
         console.print(f"Blocking apps: [magenta]{', '.join(blocked_apps)}[/magenta]")
 
 
-@app.command(name="list")
-def list_schedules(
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
-) -> None:
-    """List all scheduled and active instant lockouts."""
-    setup_logging(verbose=verbose)
-    sm = ScheduleManager()
-    schedules_with_info = []
-    all_rows = []
-    from datetime import date
+def _schedules_mtime_ns(sm: "ScheduleManager") -> int | None:
+    try:
+        return sm.schedules_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
 
-    today_str = date.today().isoformat()
 
+def _write_list_index(sm: "ScheduleManager", schedule_ids: list[str]) -> None:
+    """Records the schedule IDs in the order `list` numbered them."""
+    import json
+
+    from lock_me_out.settings import settings
+
+    index = {"schedules_mtime_ns": _schedules_mtime_ns(sm), "ids": schedule_ids}
+    try:
+        settings.list_index_file.write_bytes(json.dumps(index).encode())
+    except OSError:
+        pass
+
+
+def _numbered_schedules(sm: "ScheduleManager", today_str: str) -> list[tuple]:
+    """
+    Returns (schedule, delay, duration, total) in the order `list` numbers them.
+
+    This is file order, skipped schedules included, so `remove` can resolve
+    an index the same way when no fresh list index is available.
+    """
+    from lock_me_out.utils.time import calculate_from_range
+
+    schedules_with_info = []
     for sched in sm.schedules:
         if not sched.enabled:
             continue
-        
+
         is_skipped = today_str in sched.skipped_dates
         if is_skipped:
             # For skipped schedules, we don't need to calculate time.
@@ -237,69 +471,95 @@ def list_schedules(
             except ValueError:
                 # This can happen for past, non-persistent schedules. Skip them.
                 continue
+    return schedules_with_info
+
+
+def _read_list_index(sm: "ScheduleManager") -> list[str] | None:
+    """Returns the IDs numbered by the last `list`, or None if schedules changed."""
+    import json
+
+    from lock_me_out.settings import settings
+
+    try:
+        index = json.loads(settings.list_index_file.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if index.get("schedules_mtime_ns") != _schedules_mtime_ns(sm):
+        return None
+    return index.get("ids")
+
+
+@app.command(name="list")
+def list_schedules(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
+) -> None:
+    """List all scheduled and active instant lockouts."""
+    from datetime import date
+
+    from rich.table import Table
+    from rich.text import Text
+
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.utils.logging import setup_logging
+
+    setup_logging(verbose=verbose)
+    console = _console()
+    sm = ScheduleManager()
+    all_rows = []
+
+    today_str = date.today().isoformat()
+    schedules_with_info = _numbered_schedules(sm, today_str)
+
+    _write_list_index(sm, [str(info[0].id) for info in schedules_with_info])
 
     # Check for an active lockout from the state file
-    active_lockout = None
-    if settings.state_file.exists():
-        try:
-            with open(settings.state_file) as f:
-                state = json.load(f)
-                active_lockout = state.get("active_lockout")
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    active_lockout = _read_state().get("active_lockout")
 
-    active_sched_id = active_lockout.get("schedule_id") if active_lockout else None
+    active_sched_id = None
+    active_countdown = ""
+    if active_lockout:
+        active_sched_id = active_lockout.get("schedule_id")
+        phase = active_lockout.get("current_phase")
+        if active_sched_id and phase != "WAITING":
+            # Schedule rows show any phase but WAITING as ending, unlike
+            # the instant row, which falls back to "N/A"
+            phase = "LOCKED"
+        active_countdown = _format_countdown(_remaining_secs(active_lockout), phase)
 
     # 1. Process scheduled lockouts
+    # Bound once: these run per row, and lists can be long
+    append_row = all_rows.append
+    active_id_str = str(active_sched_id) if active_sched_id else None
     for i, (
         sched,
         delay_secs,
         duration_secs,
         total_secs,
     ) in enumerate(schedules_with_info, 1):
-        is_active = active_sched_id and str(sched.id) == str(active_sched_id)
-        
+        is_active = active_id_str is not None and str(sched.id) == active_id_str
+
         is_skipped = today_str in sched.skipped_dates
 
-        status_text = ""
         if is_active:
             # This schedule is currently active, we'll combine info
-            rem_secs = active_lockout.get("remaining_secs", 0)
-            current_phase = active_lockout.get("current_phase")
-            if current_phase == "WAITING":
-                status_text = (
-                    f"Starts in {rem_secs // 60}m"
-                    if rem_secs > 60
-                    else f"Starts in {rem_secs}s"
-                )
-            else:
-                status_text = (
-                    f"Ends in {rem_secs // 60}m"
-                    if rem_secs > 60
-                    else f"Ends in {rem_secs}s"
-                )
+            status_text = active_countdown
         elif is_skipped:
-            status_text = "[yellow](skipped)[/yellow]"
+            status_text = Text("(skipped)", style="yellow")
         else:
-            if delay_secs < 60:
-                status_text = f"{delay_secs}s" if delay_secs > 0 else "NOW"
-            elif delay_secs < 3600:
-                status_text = f"{delay_secs // 60}m"
-            else:
-                status_text = f"{delay_secs // 3600}h {(delay_secs % 3600) // 60}m"
+            status_text = _fmt_delay(delay_secs)
 
         indicator = f"S{i}" if is_active else str(i)
         mode = "Apps Only" if sched.block_only else "Full Lock"
-        blocked_apps = ", ".join(sched.blocked_apps) if sched.blocked_apps else "None"
+        blocked_apps = _apps_str(sched.blocked_apps)
 
-        all_rows.append(
+        append_row(
             (
                 -1 if is_active else delay_secs,
                 indicator,
                 sched.start_time,
                 sched.end_time,
                 status_text,
-                format_duration_seconds(total_secs),
+                _fmt_duration(total_secs),
                 mode,
                 blocked_apps,
                 "Yes" if sched.persist else "No",
@@ -309,27 +569,9 @@ def list_schedules(
 
     # 2. Check for an active lockout that is NOT from a schedule (e.g. instant)
     if active_lockout and not active_sched_id:
-        rem_secs = active_lockout.get("remaining_secs", 0)
-        current_phase = active_lockout.get("current_phase")
-
-        if current_phase == "WAITING":
-            status_text = (
-                f"Starts in {rem_secs // 60}m"
-                if rem_secs > 60
-                else f"Starts in {rem_secs}s"
-            )
-        elif current_phase == "LOCKED":
-            status_text = (
-                f"Ends in {rem_secs // 60}m"
-                if rem_secs > 60
-                else f"Ends in {rem_secs}s"
-            )
-        else:
-            status_text = "N/A"
-
+        status_text = active_countdown
         mode = "Apps Only" if active_lockout.get("block_only") else "Full Lock"
-        apps = active_lockout.get("blocked_apps", [])
-        blocked_apps_str = ", ".join(apps) if apps else "None"
+        blocked_apps_str = _apps_str(active_lockout.get("blocked_apps", []))
 
         is_instant = active_lockout.get("source") == "instant"
         indicator = "⚡" if is_instant else "S"
@@ -342,7 +584,7 @@ def list_schedules(
                 active_lockout.get("start_time", "Now"),
                 active_lockout.get("end_time", "..."),
                 status_text,
-                format_duration_seconds(active_lockout.get("duration_mins", 0) * 60),
+                _fmt_duration(active_lockout.get("duration_mins", 0) * 60),
                 mode,
                 blocked_apps_str,
                 "No",
@@ -351,25 +593,46 @@ def list_schedules(
         )
 
     # 3. Sort and render table
-    all_rows.sort(key=lambda x: x[0])
+    all_rows.sort(key=itemgetter(0))
 
     if not all_rows:
         console.print("[yellow]No scheduled or active lockouts found.[/yellow]")
         return
 
-    table = Table(title="Active & Scheduled Lockouts")
-    table.add_column("#", justify="right", style="cyan", no_wrap=True)
-    table.add_column("Start", style="magenta")
-    table.add_column("End", style="magenta")
-    table.add_column("Status", style="green")
-    table.add_column("Duration", style="blue")
-    table.add_column("Mode", style="yellow")
-    table.add_column("Blocked Apps", style="magenta")
-    table.add_column("Persist", style="yellow")
-    table.add_column("Description", style="white")
+    columns = (
+        "#",
+        "Start",
+        "End",
+        "Status",
+        "Duration",
+        "Mode",
+        "Blocked Apps",
+        "Persist",
+        "Description",
+    )
+
+    if len(all_rows) > _PLAIN_TABLE_THRESHOLD:
+        # Laying out a Rich table gets slow for very long lists; print plain
+        # tab-separated rows instead.
+        lines = ["\t".join(columns)]
+        lines.extend("\t".join(str(cell) for cell in row[1:]) for row in all_rows)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
 
+    table = Table(title="Active & Scheduled Lockouts")
+    table.add_column(columns[0], justify="right", style="cyan", no_wrap=True)
+    table.add_column(columns[1], style="magenta")
+    table.add_column(columns[2], style="magenta")
+    table.add_column(columns[3], style="green")
+    table.add_column(columns[4], style="blue")
+    table.add_column(columns[5], style="yellow")
+    table.add_column(columns[6], style="magenta")
+    table.add_column(columns[7], style="yellow")
+    table.add_column(columns[8], style="white")
+
+    add_row = table.add_row
     for row in all_rows:
-        table.add_row(*row[1:])
+        add_row(*row[1:])
 
     console.print(table)
 
@@ -379,14 +642,18 @@ def unskip(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Re-enables any persistent schedules that were skipped for today."""
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
     sm = ScheduleManager()
     sm.reset_skipped_schedules()
+    _notify_daemon()
     console.print("[green]Reset skipped schedules for today.[/green]")
     console.print("Any persistent schedules that were forcibly removed will now be active again.")
 
 
-
 @app.command()
 def remove(
     index: str = typer.Argument(
@@ -395,9 +662,12 @@ def remove(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Remove a schedule by its index in the list."""
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
     sm = ScheduleManager()
-    schedules_with_info = sm.check_schedules()
 
     # Handle S1, S2 style indices
     idx_str = index.upper()
@@ -407,26 +677,28 @@ def remove(
     try:
         idx = int(idx_str)
     except ValueError:
-        console.print(f"[red]Error:[/red] Invalid index format: {index}")
-        raise typer.Exit(1)
+        _die(f"Invalid index format: {index}")
 
-    if idx < 1 or idx > len(schedules_with_info):
-        console.print(f"[red]Error:[/red] Index {idx} is out of range.")
-        raise typer.Exit(1)
+    # Prefer the numbering from the last `lmout list` if schedules are unchanged
+    target_sched = None
+    listed_ids = _read_list_index(sm)
+    if listed_ids is not None:
+        if idx < 1 or idx > len(listed_ids):
+            _die(f"Index {idx} is out of range.")
+        target_id = listed_ids[idx - 1]
+        target_sched = sm.get_schedule(target_id)
+
+    if target_sched is None:
+        from datetime import date
 
-    target_sched, _, _, _ = schedules_with_info[idx - 1]
+        schedules_with_info = _numbered_schedules(sm, date.today().isoformat())
+        if idx < 1 or idx > len(schedules_with_info):
+            _die(f"Index {idx} is out of range.")
+        target_sched, _, _, _ = schedules_with_info[idx - 1]
 
     # Check if this schedule is the active one
-    active_sched_id = None
-    if settings.state_file.exists():
-        try:
-            with open(settings.state_file) as f:
-                state = json.load(f)
-                active_lockout = state.get("active_lockout")
-                if active_lockout:
-                    active_sched_id = active_lockout.get("schedule_id")
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    active_lockout = _read_state().get("active_lockout")
+    active_sched_id = active_lockout.get("schedule_id") if active_lockout else None
 
     if active_sched_id and str(target_sched.id) == str(active_sched_id):
         console.print(
@@ -442,6 +714,7 @@ def remove(
         raise typer.Exit(1)
 
     sm.remove_schedule(str(target_sched.id))
+    _notify_daemon()
     console.print(
         f"[green]Removed schedule:[/green] {target_sched.start_time} - "
         f"{target_sched.end_time}"
@@ -451,19 +724,18 @@ def remove(
 @app.command(name="force-remove")
 def force_remove(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
+    legacy: bool = typer.Option(
+        False, "--legacy", help="Send the command via the command file, not the socket"
+    ),
 ) -> None:
     """Forcibly removes the currently active lockout after a 30-second cooldown."""
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
 
     # Check if there is an active lockout
-    active_lockout = None
-    if settings.state_file.exists():
-        try:
-            with open(settings.state_file) as f:
-                state = json.load(f)
-                active_lockout = state.get("active_lockout")
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    active_lockout = _read_state().get("active_lockout")
 
     if not active_lockout:
         console.print("[yellow]No active lockout session found to remove.[/yellow]")
@@ -512,10 +784,10 @@ def force_remove(
     active_sched_id = active_lockout.get("schedule_id")
     is_persistent = False
     if active_sched_id:
+        from lock_me_out.manager import ScheduleManager
+
         sm = ScheduleManager()
-        target_sched = next(
-            (s for s in sm.schedules if str(s.id) == active_sched_id), None
-        )
+        target_sched = sm.get_schedule(active_sched_id)
         if target_sched and target_sched.persist:
             is_persistent = True
 
@@ -524,17 +796,11 @@ def force_remove(
         "schedule_id": active_sched_id,
         "is_persistent": is_persistent,
     }
-    try:
-        with open(settings.command_file, "w") as f:
-            json.dump(command, f)
-    except IOError as e:
-        console.print(f"[red]Error:[/red] Could not send command to daemon: {e}")
-        raise typer.Exit(1)
+    _send_command(command, legacy)
 
     console.print("Command sent. The lockout should stop shortly.")
 
 
-
 @app.command()
 def config(
     lead_mins: int | None = typer.Option(
@@ -558,49 +824,56 @@ def config(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Configure notification and app blocking settings."""
+    from rich.table import Table
+
+    from lock_me_out.settings import load_settings
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
     current_settings = load_settings()
+    before = current_settings.model_dump()
+
+    with current_settings.buffered() as s:
+        if lead_mins is not None:
+            s.notify_lead_minutes = lead_mins
+        if summary is not None:
+            s.notify_summary = summary
+        if body is not None:
+            s.notify_body = body
+        if apps:
+            s.blocked_apps = process_apps_list(apps)
 
-    if lead_mins is not None:
-        current_settings.notify_lead_minutes = lead_mins
-    if summary is not None:
-        current_settings.notify_summary = summary
-    if body is not None:
-        current_settings.notify_body = body
-    if apps:
-        current_settings.blocked_apps = process_apps_list(apps)
-    
-    if max_app_block_mins is not None:
-        if max_app_block_mins < 1:
-            console.print("[red]Error:[/red] Maximum app-block duration must be at least 1 minute.")
-            raise typer.Exit(1)
-        current_settings.MAX_APP_BLOCK_MINUTES = max_app_block_mins
-
-    if max_total_lockout_mins is not None:
-        if max_total_lockout_mins < 1:
-            console.print("[red]Error:[/red] Maximum total lockout duration must be at least 1 minute.")
-            raise typer.Exit(1)
-        console.print(
-            "\n[bold red]!! DANGER !![/bold red]\n"
-            "You are changing the maximum duration for a TOTAL screen lockout.\n"
-            "Setting this to a high value can lock you out of your computer for an extended period "
-            "with no easy way to stop it.\n"
-            "[bold]Please be certain you understand the risks before proceeding.[/bold]"
-        )
-        try:
-            confirm = typer.confirm("Are you sure you want to set the new maximum total lockout duration?")
-        except typer.Abort:
-            console.print("\n[yellow]Confirmation aborted. Value not changed.[/yellow]")
-            raise typer.Exit(0)
-        
-        if not confirm:
-            console.print("[yellow]Confirmation denied. Value not changed.[/yellow]")
-            raise typer.Exit(0)
+        if max_app_block_mins is not None:
+            if max_app_block_mins < 1:
+                _die("Maximum app-block duration must be at least 1 minute.")
+            s.MAX_APP_BLOCK_MINUTES = max_app_block_mins
 
-        current_settings.MAX_TOTAL_LOCKOUT_MINUTES = max_total_lockout_mins
+        if max_total_lockout_mins is not None:
+            if max_total_lockout_mins < 1:
+                _die("Maximum total lockout duration must be at least 1 minute.")
+            console.print(
+                "\n[bold red]!! DANGER !![/bold red]\n"
+                "You are changing the maximum duration for a TOTAL screen lockout.\n"
+                "Setting this to a high value can lock you out of your computer for an extended period "
+                "with no easy way to stop it.\n"
+                "[bold]Please be certain you understand the risks before proceeding.[/bold]"
+            )
+            try:
+                confirm = typer.confirm("Are you sure you want to set the new maximum total lockout duration?")
+            except typer.Abort:
+                console.print("\n[yellow]Confirmation aborted. Value not changed.[/yellow]")
+                raise typer.Exit(0)
 
+            if not confirm:
+                console.print("[yellow]Confirmation denied. Value not changed.[/yellow]")
+                raise typer.Exit(0)
 
-    current_settings.save()
+            s.MAX_TOTAL_LOCKOUT_MINUTES = max_total_lockout_mins
+    # buffered() only wrote the file if something changed
+    changed = current_settings.model_dump() != before
+    if changed:
+        _notify_daemon()
 
     table = Table(title="Current Configuration")
     table.add_column("Setting", style="cyan")
@@ -612,98 +885,152 @@ def config(
     table.add_row("Max App-Block Duration (m)", str(current_settings.MAX_APP_BLOCK_MINUTES))
     table.add_row("Max Total Lockout (m)", str(current_settings.MAX_TOTAL_LOCKOUT_MINUTES))
     console.print(table)
-    console.print("[green]Configuration saved![/green]")
+    if changed:
+        console.print("[green]Configuration saved![/green]")
+    else:
+        console.print("[yellow]No changes.[/yellow]")
+
+
+@lru_cache(maxsize=1)
+def _status_texts() -> dict[str, "Text"]:
+    """Builds the fixed styled lines printed by `status`, bypassing markup parsing."""
+    from rich.text import Text
+
+    return {
+        "title": Text("Lock Me Out - Daemon Status", style="bold cyan"),
+        "running": Text("● Running", style="bold green"),
+        "stopped": Text("○ Stopped", style="bold red"),
+        "no_session": Text("\nNo lockout currently active."),
+        "start_hint": Text.assemble(
+            "\n",
+            "To start the daemon, run: ",
+            ("lmout start", "bold"),
+            " or use systemd.",
+            style="dim",
+        ),
+    }
+
+
+def _systemctl(*args: str, check: bool = False) -> "CompletedProcess[str]":
+    """
+    Runs `systemctl --user <args>` and captures its output.
+
+    systemctl is resolved to an absolute path and run with close_fds=False, so
+    subprocess can launch it via os.posix_spawn rather than fork+exec.
+    Raises FileNotFoundError when systemctl is not installed.
+    """
+    import shutil
+    import subprocess
+
+    executable = shutil.which("systemctl")
+    if executable is None:
+        raise FileNotFoundError("systemctl")
+    return subprocess.run(
+        [executable, "--user", *args],
+        capture_output=True,
+        text=True,
+        check=check,
+        close_fds=False,
+    )
+
+
+def _print_lines(lines: list["str | Text"]) -> None:
+    """
+    Prints markup strings or Text lines through Rich when stdout is a terminal.
+
+    When piped (e.g. `lmout status | grep`), the lines are reduced to plain
+    text and written directly, skipping terminal detection and ANSI rendering.
+    """
+    from rich.text import Text
+
+    if sys.stdout.isatty():
+        console = _console()
+        for line in lines:
+            console.print(line)
+        return
+
+    plain = (
+        line.plain if isinstance(line, Text) else Text.from_markup(line).plain
+        for line in lines
+    )
+    sys.stdout.write("\n".join(plain) + "\n")
+
 
 @app.command()
 def status(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable debug logging"),
 ) -> None:
     """Check the status of the daemon and active lockouts."""
-    import json
+    from rich.text import Text
+
+    from lock_me_out.settings import settings
+    from lock_me_out.utils.ipc import is_daemon_lock_held
+    from lock_me_out.utils.logging import setup_logging
 
     setup_logging(verbose=verbose)
 
-    # 1. Systemd Service Status
+    # 1. State File Status
+    state = _read_state()
+    daemon_pid = state.get("pid")
+    active_lockout = state.get("active_lockout")
+    if daemon_pid and not _is_pid_alive(daemon_pid):
+        daemon_pid = None
+
+    # 2. Systemd Service Status (only needed when the state file has no live
+    # PID). A running daemon always holds its lock file, so when nobody does
+    # there is nothing for systemctl to report and the spawn is skipped.
     is_active = False
     systemd_pid = None
-    try:
-        active_res = subprocess.run(
-            ["systemctl", "--user", "is-active", "lmout.service"],
-            capture_output=True,
-            text=True,
-        )
-        is_active = active_res.stdout.strip() == "active"
-
-        if is_active:
-            pid_res = subprocess.run(
-                [
-                    "systemctl",
-                    "--user",
-                    "show",
-                    "lmout.service",
-                    "-p",
-                    "MainPID",
-                    "--value",
-                ],
-                capture_output=True,
-                text=True,
+    if not daemon_pid and is_daemon_lock_held(settings.daemon_lock_file):
+        try:
+            # One `systemctl show` call reports both properties as Key=Value lines;
+            # parse by key since the output order is not guaranteed.
+            res = _systemctl(
+                "show", "lmout.service", "-p", "ActiveState", "-p", "MainPID"
             )
-            val = pid_res.stdout.strip()
-            if val and val != "0":
-                systemd_pid = int(val)
-    except Exception:
-        pass
-
-    # 2. State File Status
-    active_lockout = None
-    daemon_pid = None
+            props = dict(
+                line.split("=", 1) for line in res.stdout.splitlines() if "=" in line
+            )
+            is_active = props.get("ActiveState") == "active"
 
-    if settings.state_file.exists():
-        try:
-            with open(settings.state_file) as f:
-                state = json.load(f)
-                daemon_pid = state.get("pid")
-                active_lockout = state.get("active_lockout")
-
-            if daemon_pid:
-                try:
-                    os.kill(daemon_pid, 0)
-                except OSError:
-                    daemon_pid = None
+            pid = props.get("MainPID", "")
+            if is_active and pid.isdigit() and pid != "0":
+                systemd_pid = int(pid)
         except Exception:
             pass
 
     if not daemon_pid and systemd_pid:
         daemon_pid = systemd_pid
 
-    console.print("[bold cyan]Lock Me Out - Daemon Status[/bold cyan]")
-    status_text = (
-        "[bold green]● Running[/bold green]"
-        if is_active or daemon_pid
-        else "[bold red]○ Stopped[/bold red]"
-    )
-    console.print(f"Service Status: {status_text}")
+    texts = _status_texts()
+    lines: list[str | Text] = [
+        texts["title"],
+        Text.assemble(
+            "Service Status: ",
+            texts["running"] if is_active or daemon_pid else texts["stopped"],
+        ),
+    ]
 
     if daemon_pid:
-        console.print(f"Daemon PID: [magenta]{daemon_pid}[/magenta]")
+        lines.append(f"Daemon PID: [magenta]{daemon_pid}[/magenta]")
 
     if active_lockout:
         mode = (
             "App Blocking Only" if active_lockout.get("block_only") else "Full Lockout"
         )
-        console.print(f"\n[bold yellow]⚠️ ACTIVE SESSION ({mode})[/bold yellow]")
-        console.print(f"Duration: {active_lockout.get('duration_mins')}m")
-        console.print(f"Started at: {active_lockout.get('start_time')}")
+        lines.append(f"\n[bold yellow]⚠️ ACTIVE SESSION ({mode})[/bold yellow]")
+        lines.append(f"Duration: {active_lockout.get('duration_mins')}m")
+        lines.append(f"Started at: {active_lockout.get('start_time')}")
         apps = active_lockout.get("blocked_apps")
         if apps:
-            console.print(f"Blocking: [magenta]{', '.join(apps)}[/magenta]")
+            lines.append(f"Blocking: [magenta]{', '.join(apps)}[/magenta]")
     else:
-        console.print("\nNo lockout currently active.")
+        lines.append(texts["no_session"])
 
     if not is_active and not daemon_pid:
-        console.print(
-            "\n[dim]To start the daemon, run: [bold]lmout start[/bold] or use systemd.[/dim]"
-        )
+        lines.append(texts["start_hint"])
+
+    _print_lines(lines)
 
 
 @app.command()
@@ -717,7 +1044,13 @@ def start(
     ),
 ) -> None:
     """Starts and manages the lockout daemon using systemd."""
+    import subprocess
+    from pathlib import Path
+
+    from lock_me_out.utils.logging import setup_logging
+
     setup_logging(verbose=verbose)
+    console = _console()
 
     if daemonize:
         # This is the execution path for systemd. It runs the daemon in the
@@ -732,11 +1065,10 @@ def start(
 
     service_file = Path(os.path.expanduser("~/.config/systemd/user/lmout.service"))
     if not service_file.exists():
-        console.print(
-            "[red]Error:[/red] systemd service file not found. "
+        _die(
+            "systemd service file not found. "
             "Please run the `install.sh` script first."
         )
-        raise typer.Exit(1)
 
     if is_daemon_running():
         console.print("[yellow]Daemon is already running.[/yellow]")
@@ -745,17 +1077,10 @@ def start(
     console.print("Daemon is not running. Attempting to start it via systemd...")
 
     try:
-        subprocess.run(
-            ["systemctl", "--user", "start", "lmout.service"],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        _systemctl("start", "lmout.service", check=True)
 
         console.print("Waiting for daemon to initialize...")
-        time.sleep(2)
-
-        if is_daemon_running():
+        if _wait_for_daemon():
             console.print("[bold green]✔ Daemon started successfully via systemd.[/bold green]")
         else:
             console.print(
@@ -764,12 +1089,71 @@ def start(
                 "`journalctl --user -u lmout.service`."
             )
     except FileNotFoundError:
-        console.print(
-            "[red]Error:[/red] `systemctl` command not found. "
+        _die(
+            "`systemctl` command not found. "
             "This command requires a systemd-based OS."
         )
-        raise typer.Exit(1)
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Error starting systemd service:[/red]")
         console.print(f"[dim]{e.stderr}[/dim]")
         raise typer.Exit(1)
+
+
+@lru_cache(maxsize=1)
+def _commands() -> dict[str, typer.models.CommandInfo]:
+    """Maps each registered command name to its Typer command info."""
+    return {
+        info.name or info.callback.__name__.replace("_", "-"): info
+        for info in app.registered_commands
+        if info.callback is not None
+    }
+
+
+@cache
+def _click_command(name: str) -> "click.Command":
+    """Builds (once per process) the Click command for a single subcommand."""
+    import typer.main
+
+    single = typer.Typer(add_completion=False)
+    single.registered_commands.append(_commands()[name])
+    return typer.main.get_command(single)
+
+
+def _print_help() -> None:
+    """Prints top-level help from the command table without building the Typer app."""
+    commands = _commands()
+    width = max(len(name) for name in commands) + 2
+    lines = [
+        "Usage: lmout COMMAND [ARGS]...",
+        "",
+        f"  {app.info.help}",
+        "",
+        "Commands:",
+    ]
+    for name, info in commands.items():
+        summary = (info.callback.__doc__ or "").strip().splitlines()
+        lines.append(f"  {name:<{width}}{summary[0] if summary else ''}")
+    lines += ["", "Run 'lmout COMMAND --help' for the options of a command."]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def dispatch(argv: list[str] | None = None) -> None:
+    """
+    Runs the CLI, building only the subcommand that was actually invoked.
+
+    Typer converts every registered command into a Click command before
+    parsing. When the first argument names a known command, a single-command
+    app is built for it instead; help, top-level options and unknown commands
+    still go through the full app.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ("-h", "--help"):
+        _print_help()
+        return
+
+    info = _commands().get(args[0])
+    if info is None:
+        app(args=args)
+        return
+
+    _click_command(args[0])(args=args[1:], prog_name=f"lmout {args[0]}")
@@ -1,53 +1,126 @@
+import json
+import os
+import select
+import socket
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-import json
+from enum import IntEnum
+from uuid import UUID
 
-from rich.console import Console
+from loguru import logger
 
 from lock_me_out.manager import LockOutManager, ScheduleManager
-from lock_me_out.settings import load_settings, settings
+from lock_me_out.settings import Settings, load_settings, settings
+from lock_me_out.utils.ipc import (
+    hold_daemon_lock,
+    open_command_socket,
+    receive_command,
+    reply,
+)
 from lock_me_out.utils.state import write_state, cleanup_state
-
-console = Console()
+from lock_me_out.utils.watch import DirectoryWatcher, watch_directory
 
 
-def _process_commands() -> tuple[LockOutManager | None, str | None, dict | None]:
+def _max_lockout_minutes(current_settings: Settings, block_only: bool) -> int:
     """
-    Checks for and processes a command from the command file.
+    Returns the guardrail on a session's length for its lockout mode.
 
-    Returns:
-        A tuple containing (manager, schedule_id, extra_data) if a valid
-        command was processed, otherwise (None, None, None). A special
-        schedule_id 'stop_request' is used to signal termination.
+    Takes the daemon's live settings so limits changed with `lmout config`
+    apply without restarting the daemon.
     """
-    if not settings.command_file.exists():
-        return None, None, None
+    if block_only:
+        return current_settings.MAX_APP_BLOCK_MINUTES
+    return current_settings.MAX_TOTAL_LOCKOUT_MINUTES
+
+
+def _read_command_file() -> dict | None:
+    """Reads and removes a command dropped by `lmout ... --legacy`."""
+    try:
+        # The usual case, no command waiting, costs this one failed open
+        fd = os.open(settings.command_file, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.error("Error reading command file: {}", e)
+        return None
 
     try:
-        with open(settings.command_file) as f:
-            command_data = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        console.print(f"[red]Error reading command file: {e}[/red]")
-        settings.command_file.unlink()
-        return None, None, None
+        return json.loads(os.read(fd, 65536))
+    except (ValueError, OSError) as e:
+        logger.error("Error reading command file: {}", e)
+        return None
     finally:
-        if settings.command_file.exists():
-            settings.command_file.unlink()
+        os.close(fd)
+        settings.command_file.unlink(missing_ok=True)
+
+
+class Cmd(IntEnum):
+    NONE = 0
+    START_INSTANT = 1
+    STOP = 2
+
+
+@dataclass(frozen=True, slots=True)
+class CommandResult:
+    """What the loop should do about the command received this tick, if any."""
+
+    kind: Cmd
+    # The started manager for START_INSTANT
+    manager: LockOutManager | None = None
+    # State-reporting data for START_INSTANT; the raw command for STOP
+    extra: dict | None = None
+
+
+# Shared by every tick without a command, so that path allocates nothing
+NO_COMMAND = CommandResult(Cmd.NONE)
+
+
+def _process_commands(
+    server: socket.socket | None,
+    busy: bool = False,
+    current_settings: Settings | None = None,
+    read_file: bool = True,
+) -> CommandResult:
+    """
+    Checks for and processes a command from the command socket or file.
+
+    Socket clients are acked once the command has been accepted or
+    rejected; a 'start_instant' is rejected while a lockout is running.
+    The legacy command file is only opened when read_file is set.
+
+    Returns:
+        A CommandResult for a START_INSTANT or STOP command, otherwise
+        NO_COMMAND (including for rejected and 'reload' commands).
+    """
+    received = receive_command(server) if server else None
+    if received:
+        conn, command_data = received
+    else:
+        conn, command_data = None, _read_command_file() if read_file else None
+        if command_data is None:
+            return NO_COMMAND
+
+    def ack(accepted: bool) -> None:
+        if conn:
+            reply(conn, accepted)
 
     cmd = command_data.get("command")
     if cmd == "start_instant":
-        console.print("[bold blue]Received command to start instant lockout.[/bold blue]")
+        logger.info("Received command to start instant lockout.")
+        if busy:
+            logger.warning("Ignoring instant lockout: a lockout is already active.")
+            ack(False)
+            return NO_COMMAND
         delay_mins = command_data.get("delay_mins", 30)
         duration_mins = command_data.get("duration_mins", 10)
         blocked_apps = command_data.get("blocked_apps", [])
         block_only = command_data.get("block_only", True)
 
-        max_allowed_mins = (
-            settings.MAX_APP_BLOCK_MINUTES
-            if block_only
-            else settings.MAX_TOTAL_LOCKOUT_MINUTES
+        effective_duration_mins = min(
+            duration_mins,
+            _max_lockout_minutes(current_settings or load_settings(), block_only),
         )
-        effective_duration_mins = min(duration_mins, max_allowed_mins)
 
         manager = LockOutManager(
             delay_mins * 60,
@@ -64,72 +137,156 @@ def _process_commands() -> tuple[LockOutManager | None, str | None, dict | None]
             "block_only": block_only,
             "blocked_apps": blocked_apps,
         }
-        return manager, "instant", instant_data
+        ack(True)
+        return CommandResult(Cmd.START_INSTANT, manager, instant_data)
     elif cmd == "stop_lockout":
-        console.print("[bold red]Received command to stop active lockout.[/bold red]")
-        return None, "stop_request", command_data
+        logger.info("Received command to stop active lockout.")
+        ack(True)
+        return CommandResult(Cmd.STOP, extra=command_data)
+    elif cmd == "reload":
+        # Sent by the CLI after schedules or settings change; the loop
+        # re-checks schedules as soon as this returns.
+        ack(True)
+        return NO_COMMAND
+
+    ack(False)
+    return NO_COMMAND
 
-    return None, None, None
+
+def _open_server() -> socket.socket | None:
+    try:
+        return open_command_socket(settings.command_socket)
+    except (OSError, AttributeError) as e:
+        # No AF_UNIX/SOCK_SEQPACKET here; commands arrive via the file only.
+        logger.warning("Command socket unavailable ({}); using file only.", e)
+        return None
+
+
+# Bounds for how long an idle daemon sleeps between schedule checks
+_MIN_IDLE_SLEEP = 5
+_MAX_IDLE_SLEEP = 300
+
+
+def _idle_sleep(next_delay: int | None, lead_secs: int) -> float:
+    """
+    Picks how long to sleep before checking schedules again.
+
+    Sleeps until shortly before the next schedule needs preparing, bounded
+    to [5s, 5min]; the CLI sends 'reload' when schedules change, so a long
+    sleep never misses an edit.
+    """
+    if next_delay is None:
+        next_delay = 3600
+    return max(_MIN_IDLE_SLEEP, min(next_delay - lead_secs - 30, _MAX_IDLE_SLEEP))
+
+
+def _wait(
+    server: socket.socket | None,
+    watcher: DirectoryWatcher | None,
+    manager: LockOutManager | None,
+    idle_timeout: float = _MIN_IDLE_SLEEP,
+) -> set[str]:
+    """
+    Sleeps until the next tick, a command arrives, a watched file changes,
+    or the session ends.
+
+    Returns the names of watched files that changed meanwhile.
+    """
+    sources = [src for src in (server, watcher) if src is not None]
+    if not sources:
+        # Nothing can wake us early, so keep ticking
+        if manager:
+            manager.idle_event.wait(timeout=5)
+        else:
+            time.sleep(5)
+        return set()
+
+    if manager is None:
+        ready = select.select(sources, [], [], idle_timeout)[0]
+    else:
+        # The manager's wakeup fd becomes readable when the session ends
+        ready = select.select([*sources, manager], [], [], 5)[0]
+
+    if watcher not in ready:
+        return set()
+    # The loop re-reads whatever changed; just clear the events
+    changed = watcher.read()
+    if changed:
+        logger.debug("Changed: {}", ", ".join(sorted(changed)))
+    return changed
 
 
 def run_daemon():
     """Main loop for the lockout daemon."""
     sm = ScheduleManager()
-    console.print(f"[bold green]Lock Me Out daemon started...[/bold green]")
-    console.print(f"Data directory: [cyan]{settings.data_dir}[/cyan]")
-    console.print("Checking for schedules and commands. Press Ctrl+C to stop.")
+    logger.info("Lock Me Out daemon started...")
+    logger.info("Data directory: {}", settings.data_dir)
+    logger.info("Checking for schedules and commands. Press Ctrl+C to stop.")
 
     current_manager: LockOutManager | None = None
-    active_sched_id: str | None = None
+    # A schedule's UUID, or "instant" for an instant session
+    active_sched_id: UUID | str | None = None
     instant_lockout_data: dict | None = None
 
+    # Held until exit so CLIs can tell a live daemon from leftover files
+    lock_fd = hold_daemon_lock(settings.daemon_lock_file)
+    server = _open_server()
+    # Picks up --legacy command drops and edits made without a reload ping
+    watched = {settings.command_file.name, "schedules.json", "config.json"}
+    watcher = watch_directory(settings.data_dir, watched)
+    # Files changed since they were last read. Without inotify every file
+    # counts as changed on every tick; their readers are all cheap no-ops
+    # when nothing is there or nothing changed.
+    pending = set(watched)
     write_state()
 
     try:
         while True:
+            # --- Settings (re-read only after config.json changes) ---
+            if "config.json" in pending:
+                pending.discard("config.json")
+                current_settings = load_settings()
+                lead_secs = current_settings.notify_lead_minutes * 60
+
             # --- Command Processing ---
             # Always check for commands first, so we can stop a running session.
-            new_manager, new_id, extra_data = _process_commands()
+            busy = bool(current_manager) and not current_manager.idle_event.is_set()
+            read_file = settings.command_file.name in pending
+            pending.discard(settings.command_file.name)
+            command = _process_commands(server, busy, current_settings, read_file)
 
-            if new_id == "stop_request":
+            if command.kind is Cmd.STOP:
                 if current_manager:
-                    console.print(
-                        "[bold red]Stopping active lockout via force-remove.[/bold red]"
-                    )
+                    logger.info("Stopping active lockout via force-remove.")
                     current_manager.stop()  # This should terminate threads and cleanup
 
                     # If the stopped schedule was persistent, skip it for today
-                    if extra_data and extra_data.get("is_persistent"):
-                        sched_id = extra_data.get("schedule_id")
+                    if command.extra and command.extra.get("is_persistent"):
+                        sched_id = command.extra.get("schedule_id")
                         if sched_id:
                             sm.skip_schedule_today(sched_id)
                 else:
-                    console.print(
-                        "[yellow]Received stop command but no active lockout found.[/yellow]"
-                    )
+                    logger.warning("Received stop command but no active lockout found.")
                 # Setting manager to None triggers cleanup logic in the is_idle block
                 current_manager = None
                 # Continue to the start of the loop to re-evaluate state immediately
-                time.sleep(1)
                 continue
 
             # --- Schedule & State Processing ---
-            is_idle = not current_manager or (
-                current_manager.get_status()["state"] == "IDLE"
+            idle_timeout = _MIN_IDLE_SLEEP
+            is_idle = (
+                not current_manager or current_manager.get_status().state == "IDLE"
             )
 
             if is_idle:
                 # 1. Clear previous finished session
                 if active_sched_id:
                     if active_sched_id != "instant":
-                        finished_sched = next(
-                            (s for s in sm.schedules if str(s.id) == active_sched_id),
-                            None,
-                        )
+                        finished_sched = sm.get_schedule(active_sched_id)
                         if finished_sched and not finished_sched.persist:
-                            console.print(
-                                f"[dim]Removing finished one-time schedule: "
-                                f"{finished_sched.start_time}[/dim]"
+                            logger.info(
+                                "Removing finished one-time schedule: {}",
+                                finished_sched.start_time,
                             )
                             sm.remove_schedule(finished_sched.id)
                     current_manager = None
@@ -137,23 +294,27 @@ def run_daemon():
                     instant_lockout_data = None
 
                 # 2. Process a 'start_instant' command if it was received
-                if new_manager:
-                    current_manager = new_manager
-                    active_sched_id = new_id
-                    instant_lockout_data = extra_data
+                if command.kind is Cmd.START_INSTANT:
+                    current_manager = command.manager
+                    active_sched_id = "instant"
+                    instant_lockout_data = command.extra
                 else:
                     # 3. Check for upcoming scheduled lockouts
-                    sm._load_schedules()
-                    current_settings = load_settings()
-                    candidates = sm.check_schedules()
-                    lead_secs = current_settings.notify_lead_minutes * 60
+                    if "schedules.json" in pending:
+                        pending.discard("schedules.json")
+                        sm._load_schedules()
+                    upcoming = sm.next_schedule()
+                    idle_timeout = _idle_sleep(
+                        upcoming[1] if upcoming else None, lead_secs
+                    )
 
-                    if candidates:
-                        sched, delay_secs, duration_secs, total_secs = candidates[0]
+                    if upcoming:
+                        sched, delay_secs, duration_secs, total_secs = upcoming
                         if delay_secs < lead_secs + 30:
-                            console.print(
-                                f"[bold yellow]Preparing scheduled lockout:[/bold yellow] "
-                                f"{sched.start_time} - {sched.end_time}"
+                            logger.info(
+                                "Preparing scheduled lockout: {} - {}",
+                                sched.start_time,
+                                sched.end_time,
                             )
                             summary = current_settings.notify_summary.format(
                                 minutes=current_settings.notify_lead_minutes
@@ -162,20 +323,17 @@ def run_daemon():
                                 start_time=sched.start_time
                             )
 
-                            max_allowed_mins = (
-                                settings.MAX_APP_BLOCK_MINUTES
-                                if sched.block_only
-                                else settings.MAX_TOTAL_LOCKOUT_MINUTES
-                            )
                             effective_duration_secs = min(
-                                duration_secs, max_allowed_mins * 60
+                                duration_secs,
+                                _max_lockout_minutes(current_settings, sched.block_only)
+                                * 60,
                             )
 
                             current_manager = LockOutManager(
                                 delay_secs,
                                 effective_duration_secs,
                             )
-                            active_sched_id = str(sched.id)
+                            active_sched_id = sched.id
                             current_manager.start(
                                 blocked_apps=sched.blocked_apps,
                                 block_only=sched.block_only,
@@ -184,40 +342,47 @@ def run_daemon():
 
             # --- State Reporting ---
             active_info = None
-            if current_manager and current_manager.get_status()["state"] != "IDLE":
-                status = current_manager.get_status()
+            status = current_manager.get_status() if current_manager else None
+            if status and status.state != "IDLE":
                 is_instant = active_sched_id == "instant"
 
                 if is_instant and instant_lockout_data:
                     active_info = {
                         "source": "instant",
                         "schedule_id": None,
-                        "current_phase": status["state"],
-                        "remaining_secs": status["time_remaining"],
+                        "current_phase": status.state,
+                        "ends_at": status.ends_at,
                         **instant_lockout_data,
                     }
                 elif not is_instant:
-                    sched = next(
-                        (s for s in sm.schedules if str(s.id) == active_sched_id), None
-                    )
+                    sched = sm.get_schedule(active_sched_id)
                     if sched:
                         active_info = {
                             "source": "schedule",
-                            "schedule_id": active_sched_id,
-                            "current_phase": status["state"],
+                            "schedule_id": str(active_sched_id),
+                            "current_phase": status.state,
                             "start_time": sched.start_time,
                             "end_time": sched.end_time,
                             "duration_mins": current_manager.lockout_duration_seconds
                             // 60,
                             "block_only": sched.block_only,
                             "blocked_apps": sched.blocked_apps,
-                            "remaining_secs": status["time_remaining"],
+                            "ends_at": status.ends_at,
                         }
             write_state(active_info)
 
-            time.sleep(5)
+            # Wake up as soon as a command arrives or the session ends
+            pending |= _wait(server, watcher, current_manager, idle_timeout)
+            if watcher is None:
+                pending |= watched
     finally:
-        console.print("\n[yellow]Stopping daemon...[/yellow]")
+        logger.info("Stopping daemon...")
         if current_manager:
             current_manager.stop()
+        if watcher:
+            watcher.close()
+        if server:
+            server.close()
+            settings.command_socket.unlink(missing_ok=True)
+        os.close(lock_fd)
         cleanup_state()
@@ -1,9 +1,9 @@
-from lock_me_out.cli import app
+from lock_me_out.cli import dispatch
 
 
 def main():
     """Entry point for the lmout CLI."""
-    app()
+    dispatch()
 
 
 if __name__ == "__main__":
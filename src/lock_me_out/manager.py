@@ -1,11 +1,17 @@
-import json
+import os
 import threading
 import time
+import weakref
+from datetime import date, datetime
+from typing import NamedTuple
+from uuid import UUID
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from lock_me_out.schema import LockSchedule
 from lock_me_out.settings import settings
+from lock_me_out.utils.files import read_if_changed, write_atomic
 from lock_me_out.utils.notifications import send_notification
 from lock_me_out.utils.processes import (
     is_screen_locked,
@@ -15,6 +21,23 @@ from lock_me_out.utils.processes import (
 )
 from lock_me_out.utils.time import calculate_from_range
 
+# Respawning apps (browsers) get killed every sweep; tell the user at most
+# this often per app.
+_KILL_NOTIFY_INTERVAL = 60.0
+
+
+class ManagerStatus(NamedTuple):
+    state: str
+    time_remaining: int
+    # Wall-clock (epoch seconds) end of the current phase, 0 when idle.
+    # Unlike time_remaining it stays put for the whole phase.
+    ends_at: int = 0
+
+
+def _close_fds(*fds: int):
+    for fd in fds:
+        os.close(fd)
+
 
 class LockOutManager:
     """Manages the lifecycle of a single lockout session."""
@@ -26,18 +49,47 @@ class LockOutManager:
         self._thread: threading.Thread | None = None
         self._running = False
         self._state = "IDLE"  # IDLE, WAITING, LOCKED
+        # Deadline of the current phase on the monotonic clock, so wall-clock
+        # jumps (NTP, manual changes) do not stretch or cut a session short
         self._target_end_time = 0.0
+        # Set whenever the manager is IDLE, so callers can block until a
+        # session finishes instead of polling get_status().
+        self.idle_event = threading.Event()
+        self.idle_event.set()
+        # Pipe mirroring idle_event for select(): readable while IDLE, so
+        # the daemon can sleep on it next to its socket and watcher
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        weakref.finalize(self, _close_fds, self._wakeup_r, self._wakeup_w)
+        os.write(self._wakeup_w, b"\0")
         self.blocked_apps: list[str] = []
+        self._blocked_set: frozenset[str] = frozenset()
+        # App name -> monotonic time of the last "Blocked" notification
+        self._notified_kills: dict[str, float] = {}
         self.block_only: bool = False
         self.start_notification: tuple[str, str] | None = None
 
-    def get_status(self):
+    def fileno(self) -> int:
+        """The read end of the wakeup pipe; readable once the manager is IDLE."""
+        return self._wakeup_r
+
+    def _mark_idle(self):
+        self._state = "IDLE"
+        self.idle_event.set()
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            pass  # Pipe full, so already readable
+
+    def get_status(self) -> ManagerStatus:
         """Returns the current status of the manager."""
-        remaining = 0
-        if self._state != "IDLE" and self._target_end_time > 0:
-            remaining = max(0, int(self._target_end_time - time.time()))
+        state = self._state
+        if state == "IDLE" or self._target_end_time <= 0:
+            return ManagerStatus(state, 0)
 
-        return {"state": self._state, "time_remaining": remaining}
+        left = self._target_end_time - time.monotonic()
+        return ManagerStatus(state, max(0, int(left)), round(time.time() + left))
 
     def start(
         self,
@@ -51,17 +103,29 @@ class LockOutManager:
             return
 
         self.blocked_apps = blocked_apps or []
+        # Matched against every process once per tick during the lockout
+        self._blocked_set = frozenset(self.blocked_apps)
+        self._notified_kills = {}
         self.block_only = block_only
         self.start_notification = start_notification
 
         logger.info(
-            f"Starting LockOutManager: Delay={self.initial_delay_seconds}s, "
-            f"Duration={self.lockout_duration_seconds}s, "
-            f"BlockOnly={self.block_only}, Apps={self.blocked_apps}"
+            "Starting LockOutManager: Delay={}s, Duration={}s, BlockOnly={}, Apps={}",
+            self.initial_delay_seconds,
+            self.lockout_duration_seconds,
+            self.block_only,
+            self.blocked_apps,
         )
         self._stop_event.clear()
         self._running = True
+        self._target_end_time = time.monotonic() + self.initial_delay_seconds
         self._state = "WAITING"
+        self.idle_event.clear()
+        try:
+            while os.read(self._wakeup_r, 64):
+                pass
+        except BlockingIOError:
+            pass  # Drained
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
@@ -75,7 +139,7 @@ class LockOutManager:
         if self._thread:
             self._thread.join(timeout=2.0)
         self._running = False
-        self._state = "IDLE"
+        self._mark_idle()
         logger.info("LockOutManager stopped.")
 
     def _run(self):
@@ -88,10 +152,10 @@ class LockOutManager:
             self._perform_lockout()
 
         except Exception as e:
-            logger.exception(f"Error in LockOutManager: {e}")
+            logger.exception("Error in LockOutManager: {}", e)
         finally:
             self._running = False
-            self._state = "IDLE"
+            self._mark_idle()
 
     def _wait_initial_delay(self):
         """Waits for the initial delay, sending notifications at milestones."""
@@ -100,66 +164,119 @@ class LockOutManager:
 
         logger.info("Waiting for initial delay...")
 
+        self._target_end_time = time.monotonic() + self.initial_delay_seconds
         self._state = "WAITING"
-        self._target_end_time = time.time() + self.initial_delay_seconds
         end_time = self._target_end_time
 
-        notified_one_minute = False
-
-        while time.time() < end_time:
-            remaining = end_time - time.time()
+        # Sleep straight to the next thing that needs doing: the 1-minute
+        # warning (if the delay is long enough to have one), then the end.
+        warn_at = end_time - 60
+        now = time.monotonic()
+        if now < warn_at:
+            if self._stop_event.wait(timeout=warn_at - now):
+                return  # Stop event was set, exit early
+            send_notification(
+                "1 minute remaining before lockout.", "MAKE SURE TO REST!"
+            )
 
-            if 60 <= remaining < 61 and not notified_one_minute:
-                send_notification(
-                    "1 minute remaining before lockout.", "MAKE SURE TO REST!"
-                )
-                notified_one_minute = True
+        remaining = end_time - time.monotonic()
+        if remaining > 0 and self._stop_event.wait(timeout=remaining):
+            return
 
-            # Sleep for remaining time or a maximum of 5 seconds to re-check
-            sleep_duration = min(remaining, 5.0)
-            if sleep_duration <= 0:
-                break
+    def _notify_kills(self, killed: set[str]):
+        """Sends one notification for apps not already reported recently."""
+        now = time.monotonic()
+        fresh = sorted(
+            name
+            for name in killed
+            if name not in self._notified_kills
+            or now - self._notified_kills[name] > _KILL_NOTIFY_INTERVAL
+        )
+        if not fresh:
+            return
+        for name in fresh:
+            self._notified_kills[name] = now
 
-            if self._stop_event.wait(timeout=sleep_duration):
-                return  # Stop event was set, exit early
+        if len(fresh) == 1:
+            send_notification(f"Blocked {fresh[0]}", "App closed per schedule.")
+        else:
+            send_notification(
+                "Blocked apps", f"{', '.join(fresh)} closed per schedule."
+            )
 
     def _perform_lockout(self):
         """Executes the lockout phase (app blocking and screen locking)."""
         logger.info("Initial delay complete. Initiating lockout.")
+        self._target_end_time = time.monotonic() + self.lockout_duration_seconds
         self._state = "LOCKED"
-
-        self._target_end_time = time.time() + self.lockout_duration_seconds
         end_time = self._target_end_time
+        # With no apps to sweep and no screen to keep locked there is nothing
+        # to repeat, so block-only sessions without apps wait in one go.
+        sweep_interval = 2.0 if self._blocked_set or not self.block_only else None
+        was_locked = False
 
-        while time.time() < end_time:
+        while time.monotonic() < end_time:
             if self._stop_event.is_set():
                 return
 
             # Kill specific blocked apps
-            if self.blocked_apps:
-                kill_processes(self.blocked_apps)
-
-            # Check and lock screen (if not block-only)
+            if self._blocked_set:
+                killed = kill_processes(self._blocked_set)
+                if killed:
+                    self._notify_kills(killed)
+
+            # Check and lock screen (if not block-only). Each check spawns a
+            # helper process, so only re-check after actually locking.
+            locked = False
             if not self.block_only:
-                if not is_screen_locked():
+                locked = is_screen_locked()
+                if not locked:
                     lock_screen()
+                    locked = is_screen_locked()
 
             # Smart Wait: If screen is locked, use event monitor (efficient).
             # If not locked (or block-only), poll normally.
-            if not self.block_only and is_screen_locked():
-                # Wait efficiently for unlock signal or timeout (10s)
-                logger.debug("Screen is locked. Entering efficient wait (D-Bus monitor).")
-                wait_for_unlock(self._stop_event, timeout=10)
+            remaining = max(0.0, end_time - time.monotonic())
+            if locked:
+                # Wait efficiently for unlock signal or timeout (10s), but
+                # never past the end of the session. Only the first wait of a
+                # locked stretch is logged, not every 10s re-check.
+                if not was_locked:
+                    logger.debug(
+                        "Screen is locked. Entering efficient wait (D-Bus monitor)."
+                    )
+                wait_for_unlock(self._stop_event, timeout=min(10.0, remaining))
             else:
-                # Wait for 2 seconds or until stop event is set
-                if self._stop_event.wait(timeout=2):
+                # Wait until the next sweep (or the end) unless stopped first
+                if sweep_interval is not None:
+                    remaining = min(sweep_interval, remaining)
+                if self._stop_event.wait(timeout=remaining):
                     return  # Stop event was set, exit early
+            was_locked = locked
 
         if not self._stop_event.is_set():
             logger.info("Lockout duration finished.")
             send_notification("Lockout Finished", "You can now resume your work.")
 
 
+# Parses/serialises the whole schedules file in pydantic-core, without an
+# intermediate json.load and a LockSchedule(**d) call per entry
+_SCHEDULES_ADAPTER = TypeAdapter(list[LockSchedule])
+
+
+# Stands in for an mtime when schedules.json does not exist
+_MISSING = -1
+
+
+def _as_uuid(schedule_id: UUID | str) -> UUID | None:
+    """Normalises an ID from the CLI or state file; None if malformed."""
+    if isinstance(schedule_id, UUID):
+        return schedule_id
+    try:
+        return UUID(schedule_id)
+    except (TypeError, ValueError):
+        return None
+
 
 class ScheduleManager:
     """Manages persistence and retrieval of lock schedules."""
@@ -167,40 +284,74 @@ class ScheduleManager:
     def __init__(self):
         self.schedules_file = settings.data_dir / "schedules.json"
         self.schedules: list[LockSchedule] = []
-        self._last_schedules_mtime: float | None = None
+        # Same objects as self.schedules, for lookups by ID
+        self.by_id: dict[UUID, LockSchedule] = {}
+        # mtime_ns of the file last loaded or saved; _MISSING once the file
+        # was found absent, None before the first look
+        self._last_schedules_mtime_ns: int | None = None
+        # Contents of the file as of that load or save
+        self._last_serialized: bytes | None = None
         self._load_schedules()
 
+    def _set_schedules(self, schedules: list[LockSchedule]):
+        self.schedules = schedules
+        self.by_id = {s.id: s for s in schedules}
+
+    def get_schedule(self, schedule_id: UUID | str) -> LockSchedule | None:
+        """Returns the schedule with the given ID, if there is one."""
+        return self.by_id.get(_as_uuid(schedule_id))
+
     def _load_schedules(self):
-        if not self.schedules_file.exists():
-            self._last_schedules_mtime = None
-            self.schedules = []
+        """
+        Reloads schedules from disk.
+
+        Skipped when the file is unchanged since the last load or save.
+        """
+        try:
+            current_mtime_ns, data = read_if_changed(
+                self.schedules_file, self._last_schedules_mtime_ns
+            )
+        except FileNotFoundError:
+            if self._last_schedules_mtime_ns != _MISSING:
+                self._last_schedules_mtime_ns = _MISSING
+                self._set_schedules([])
+            return
+        except OSError as e:
+            logger.error("Failed to load schedules: {}", e)
             return
 
-        current_mtime = self.schedules_file.stat().st_mtime
-        if self._last_schedules_mtime == current_mtime:
+        if data is None:
             # File hasn't changed, no need to reload
             return
 
         try:
-            with open(self.schedules_file) as f:
-                data = json.load(f)
-                self.schedules = [LockSchedule(**s) for s in data]
-            self._last_schedules_mtime = current_mtime
+            self._set_schedules(_SCHEDULES_ADAPTER.validate_json(data))
+            self._last_schedules_mtime_ns = current_mtime_ns
+            self._last_serialized = data
         except Exception as e:
-            logger.error(f"Failed to load schedules: {e}")
+            logger.error("Failed to load schedules: {}", e)
+
+    def _file_unchanged(self) -> bool:
+        """Checks that nothing has rewritten the file since the last load or save."""
+        try:
+            mtime_ns = self.schedules_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        return mtime_ns == self._last_schedules_mtime_ns
 
     def save_schedules(self):
-        """Saves current schedules to JSON."""
+        """Saves current schedules to JSON, unless the file already holds them."""
         try:
+            data = _SCHEDULES_ADAPTER.dump_json(self.schedules, indent=4)
+            if data == self._last_serialized and self._file_unchanged():
+                return
             settings.data_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.schedules_file, "w") as f:
-                json.dump(
-                    [s.model_dump(mode="json") for s in self.schedules],
-                    f,
-                    indent=4,
-                )
+            write_atomic(self.schedules_file, data)
+            # What's on disk now matches self.schedules; skip the next reload
+            self._last_schedules_mtime_ns = self.schedules_file.stat().st_mtime_ns
+            self._last_serialized = data
         except Exception as e:
-            logger.error(f"Failed to save schedules: {e}")
+            logger.error("Failed to save schedules: {}", e)
 
     def add_schedule(
         self,
@@ -217,69 +368,103 @@ class ScheduleManager:
             end_time=end_time,
             description=description,
             persist=persist,
-            blocked_apps=blocked_apps or [],
+            blocked_apps=tuple(blocked_apps or ()),
             block_only=block_only,
         )
         self.schedules.append(schedule)
+        self.by_id[schedule.id] = schedule
         self.save_schedules()
         return schedule
 
-    def remove_schedule(self, schedule_id: str):
-        """Removes a schedule by ID."""
-        self.schedules = [s for s in self.schedules if str(s.id) != str(schedule_id)]
-        self.save_schedules()
+    def remove_schedule(self, schedule_id: UUID | str):
+        """Removes a schedule by ID; saves only if it was there."""
+        schedule = self.by_id.pop(_as_uuid(schedule_id), None)
+        if schedule is not None:
+            self.schedules.remove(schedule)
+            self.save_schedules()
 
-    def skip_schedule_today(self, schedule_id: str):
-        """Adds today's date to the schedule's skipped_dates list."""
-        from datetime import date
+    def skip_schedule_today(self, schedule_id: UUID | str):
+        """
+        Adds today's date to the schedule's skipped_dates list.
 
+        Past dates are dropped at the same time: only today's entry is ever
+        checked, and check_schedules scans this list on every idle tick.
+        """
         today_str = date.today().isoformat()
-        for s in self.schedules:
-            if str(s.id) == str(schedule_id) and today_str not in s.skipped_dates:
-                s.skipped_dates.append(today_str)
-                self.save_schedules()
-                logger.info(f"Schedule {schedule_id} skipped for today.")
-                break
+        s = self.get_schedule(schedule_id)
+        if s is not None and today_str not in s.skipped_dates:
+            # ISO dates sort as strings
+            kept = tuple(d for d in s.skipped_dates if d > today_str)
+            self._replace(s, s.model_copy(update={"skipped_dates": (*kept, today_str)}))
+            self.save_schedules()
+            logger.info("Schedule {} skipped for today.", schedule_id)
 
     def reset_skipped_schedules(self):
         """Removes today from all skipped_dates lists."""
-        from datetime import date
-
         today_str = date.today().isoformat()
         updated = False
-        for s in self.schedules:
+        for s in list(self.schedules):
             if today_str in s.skipped_dates:
-                s.skipped_dates.remove(today_str)
+                kept = tuple(d for d in s.skipped_dates if d != today_str)
+                self._replace(s, s.model_copy(update={"skipped_dates": kept}))
                 updated = True
         if updated:
             self.save_schedules()
             logger.info("Reset skipped dates for today.")
 
     def update_schedule(self, schedule: LockSchedule):
-        """Updates an existing schedule."""
-        for i, s in enumerate(self.schedules):
-            if s.id == schedule.id:
-                self.schedules[i] = schedule
-                break
-        self.save_schedules()
+        """Updates an existing schedule; saves only if it was there."""
+        old = self.by_id.get(schedule.id)
+        if old is not None:
+            self._replace(old, schedule)
+            self.save_schedules()
 
-    def check_schedules(self) -> list[tuple[LockSchedule, int, int, int]]:
+    def _replace(self, old: LockSchedule, new: LockSchedule):
+        """Swaps new in for old, which must be one of self.schedules."""
+        self.schedules[self.schedules.index(old)] = new
+        self.by_id[new.id] = new
+
+    def check_schedules(
+        self, now: datetime | None = None
+    ) -> list[tuple[LockSchedule, int, int, int]]:
         """
         Returns schedules sorted by their next activation delay.
         Includes (schedule, delay, remaining_duration, total_duration).
+
+        Every schedule is measured against the same `now` (read once if not
+        given), so delays are consistent with each other.
         """
-        from datetime import date
+        if now is None:
+            now = datetime.now()
+        return sorted(self._candidates(now), key=lambda x: x[1])
 
-        candidates = []
-        today_str = date.today().isoformat()
+    def next_schedule(
+        self, now: datetime | None = None
+    ) -> tuple[LockSchedule, int, int, int] | None:
+        """
+        Returns the first entry check_schedules would, or None.
+
+        The daemon only ever acts on the earliest schedule, so this picks it
+        in one pass instead of building and sorting the whole list.
+        """
+        if now is None:
+            now = datetime.now()
+        return min(self._candidates(now), key=lambda x: x[1], default=None)
+
+    def _candidates(self, now: datetime):
+        """
+        Yields the active schedules, as of now.
+
+        Each item is (schedule, delay, remaining_duration, total_duration).
+        """
+        today_str = now.date().isoformat()
         for s in self.schedules:
             if not s.enabled or today_str in s.skipped_dates:
                 continue
             try:
-                delay, duration, total = calculate_from_range(s.start_time, s.end_time)
-                candidates.append((s, delay, duration, total))
+                delay, duration, total = calculate_from_range(
+                    s.start_time, s.end_time, now
+                )
             except Exception:
                 continue
-
-        candidates.sort(key=lambda x: x[1])
-        return candidates
+            yield s, delay, duration, total
@@ -1,10 +1,17 @@
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LockSchedule(BaseModel):
-    """Represents a scheduled lockout session."""
+    """
+    Represents a scheduled lockout session.
+
+    Instances are immutable; ScheduleManager swaps in an updated copy
+    (model_copy) so a schedule can't be changed without going through it.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: UUID = Field(default_factory=uuid4)
     start_time: str
@@ -12,7 +19,7 @@ class LockSchedule(BaseModel):
     enabled: bool = True
     description: str | None = None
     persist: bool = False
-    blocked_apps: list[str] = Field(default_factory=list)
-    skipped_dates: list[str] = Field(default_factory=list)
+    blocked_apps: tuple[str, ...] = ()
+    skipped_dates: tuple[str, ...] = ()
 
     block_only: bool = True
@@ -1,11 +1,52 @@
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+from lock_me_out.utils.files import write_atomic
 from lock_me_out.utils.paths import get_default_data_dir, get_default_log_dir
 
+# Resolved once: resolve() stats every component of the path
+_ICON_PATH = str(Path(__file__).resolve().parent / "resources" / "icon.png")
+
+_ENV_FILE = ".env"
+
+
+@cache
+def _dotenv_source(settings_cls: type[BaseSettings]) -> DotEnvSettingsSource:
+    """The .env source for settings_cls; the file is read once per process."""
+    return DotEnvSettingsSource(
+        settings_cls, env_file=_ENV_FILE, env_file_encoding="utf-8"
+    )
+
+
+def _sources_with_cached_dotenv(
+    cls,
+    settings_cls: type[BaseSettings],
+    init_settings: PydanticBaseSettingsSource,
+    env_settings: PydanticBaseSettingsSource,
+    dotenv_settings: PydanticBaseSettingsSource,
+    file_secret_settings: PydanticBaseSettingsSource,
+) -> tuple[PydanticBaseSettingsSource, ...]:
+    """
+    The default source order, with .env served from _dotenv_source.
+
+    pydantic-settings re-reads the env file on every construction, and
+    load_settings builds a Settings each time config.json changes. The
+    classes' own env_file is left unset so that read never happens.
+    """
+    dotenv_settings = _dotenv_source(settings_cls)
+    return init_settings, env_settings, dotenv_settings, file_secret_settings
+
 
 class Settings(BaseSettings):
     """Application-wide settings managed via .env and config.json."""
@@ -30,9 +71,21 @@ class Settings(BaseSettings):
     def command_file(self) -> Path:
         return self.data_dir / "command.json"
 
+    @property
+    def command_socket(self) -> Path:
+        return self.data_dir / "command.sock"
+
+    @property
+    def daemon_lock_file(self) -> Path:
+        return self.data_dir / "daemon.lock"
+
+    @property
+    def list_index_file(self) -> Path:
+        return self.data_dir / "list_index.json"
+
     @property
     def icon_path(self) -> str:
-        return str(Path(__file__).resolve().parent / "resources" / "icon.png")
+        return _ICON_PATH
 
     # Configuration
     notify_lead_minutes: int = 3
@@ -47,54 +100,85 @@ class Settings(BaseSettings):
     MAX_TOTAL_LOCKOUT_MINUTES: int = 60  # 1 hour
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+        # .env (_ENV_FILE) is read through _sources_with_cached_dotenv
+        env_file=None,
         extra="ignore",
     )
 
+    settings_customise_sources = classmethod(_sources_with_cached_dotenv)
+
     def save(self):
         """Saves current settings to config.json in data_dir."""
         config_path = self.data_dir / "config.json"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         data = self.model_dump(mode="json")
-        with open(config_path, "w") as f:
-            json.dump(data, f, indent=4)
+        write_atomic(config_path, json.dumps(data, indent=4).encode())
+
+    @contextmanager
+    def buffered(self) -> Iterator["Settings"]:
+        """
+        Groups several field updates into a single save().
+
+        The file is written once when the block exits normally, and only if a
+        field actually changed; leaving the block with an exception writes
+        nothing.
+        """
+        before = self.model_dump()
+        yield self
+        if self.model_dump() != before:
+            self.save()
+
+
+class _DataDirSettings(BaseSettings):
+    """Just enough of Settings (from env/.env) to locate config.json."""
+
+    data_dir: Path = Field(default_factory=get_default_data_dir)
+
+    model_config = Settings.model_config
 
+    settings_customise_sources = classmethod(_sources_with_cached_dotenv)
 
-_last_settings_mtime: float | None = None
+
+_settings_cache_key: tuple[Path, int] | None = None
 _cached_settings: Settings | None = None
 
 
 def load_settings() -> Settings:
-    """Loads settings, merging with config.json if it exists."""
-    global _last_settings_mtime, _cached_settings
+    """
+    Loads settings, merging with config.json if it exists.
 
-    base_settings = Settings()
-    config_path = base_settings.data_dir / "config.json"
+    The merged result is cached against the config file's path and
+    nanosecond mtime, so repeated calls skip the JSON parse and pydantic
+    validation until the file changes. Only the data directory is read
+    to find the file, so at most one full Settings is built per call.
+    """
+    global _settings_cache_key, _cached_settings
 
-    if not config_path.exists():
-        _last_settings_mtime = None
-        _cached_settings = base_settings
-        return base_settings
+    config_path = _DataDirSettings().data_dir.resolve() / "config.json"
 
-    current_mtime = config_path.stat().st_mtime
-    if _last_settings_mtime == current_mtime and _cached_settings is not None:
+    try:
+        cache_key = (config_path, config_path.stat().st_mtime_ns)
+    except OSError:
+        _settings_cache_key = None
+        _cached_settings = Settings()
+        return _cached_settings
+
+    if _settings_cache_key == cache_key and _cached_settings is not None:
         return _cached_settings
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
+        config_data = json.loads(config_path.read_bytes())
 
         # Create a new settings object, where config_data overrides .env/defaults
         final_settings = Settings(**config_data)
         _cached_settings = final_settings
-        _last_settings_mtime = current_mtime
+        _settings_cache_key = cache_key
         return final_settings
     except Exception:
         # On error (e.g. malformed json), return settings from .env/defaults
-        _cached_settings = base_settings
-        _last_settings_mtime = None  # Bust cache
-        return base_settings
+        _cached_settings = Settings()
+        _settings_cache_key = None  # Bust cache
+        return _cached_settings
 
 
 # The single source of truth for the app
@@ -0,0 +1,40 @@
+import os
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Replaces path's contents with data in a single write.
+
+    The bytes go to a sibling temp file that is then renamed over path, so
+    readers (and inotify watchers, via IN_MOVED_TO) only ever see the old
+    file or the complete new one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def read_if_changed(path: Path, mtime_ns: int | None) -> tuple[int, bytes | None]:
+    """
+    Reads path unless its mtime still equals mtime_ns.
+
+    Returns (current_mtime_ns, contents), with contents None when unchanged.
+    The mtime comes from fstat on the descriptor the bytes are read from,
+    so it always describes those bytes. Raises FileNotFoundError.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        if st.st_mtime_ns == mtime_ns:
+            return st.st_mtime_ns, None
+        chunks = []
+        while chunk := os.read(fd, max(st.st_size, 65536)):
+            chunks.append(chunk)
+        return st.st_mtime_ns, b"".join(chunks)
+    finally:
+        os.close(fd)
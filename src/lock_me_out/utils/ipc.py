@@ -0,0 +1,104 @@
+import json
+import os
+import socket
+from pathlib import Path
+
+ACK_ACCEPTED = b"\x01"
+ACK_REJECTED = b"\x00"
+
+_MAX_MESSAGE = 64 * 1024
+
+
+def send_command(path: Path, command: dict, timeout: float = 5.0) -> bool:
+    """
+    Sends a command to the daemon over its Unix socket and waits for the ack.
+
+    Returns True if the daemon accepted the command. Raises
+    ConnectionRefusedError or FileNotFoundError when nothing is listening.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(command).encode())
+        return sock.recv(1) == ACK_ACCEPTED
+
+
+def open_command_socket(path: Path) -> socket.socket:
+    """Binds a non-blocking listening socket at path, replacing a stale one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    server.bind(str(path))
+    os.chmod(path, 0o600)
+    server.listen(4)
+    server.setblocking(False)
+    return server
+
+
+def receive_command(server: socket.socket) -> tuple[socket.socket, dict] | None:
+    """
+    Accepts one pending command, if any.
+
+    Returns the client connection and the decoded command; the caller
+    replies with reply() once it has decided whether to accept it.
+    """
+    try:
+        conn, _ = server.accept()
+    except BlockingIOError:
+        return None
+
+    conn.settimeout(1.0)
+    try:
+        command = json.loads(conn.recv(_MAX_MESSAGE))
+    except (OSError, ValueError):
+        conn.close()
+        return None
+    if not isinstance(command, dict):
+        conn.close()
+        return None
+    return conn, command
+
+
+def reply(conn: socket.socket, accepted: bool) -> None:
+    """Acks a received command and closes the connection."""
+    with conn:
+        try:
+            conn.sendall(ACK_ACCEPTED if accepted else ACK_REJECTED)
+        except OSError:
+            pass
+
+
+def hold_daemon_lock(path: Path) -> int:
+    """
+    Takes a shared flock on path for the life of the daemon process.
+
+    Returns the descriptor, which must stay open; the kernel drops the lock
+    when the process exits, however it exits.
+    """
+    import fcntl
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.flock(fd, fcntl.LOCK_SH)
+    return fd
+
+
+def is_daemon_lock_held(path: Path) -> bool:
+    """Checks whether a live daemon holds its lock on path."""
+    import fcntl
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    return False
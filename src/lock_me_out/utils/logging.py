@@ -33,7 +33,8 @@ def setup_logging(verbose: bool = False) -> None:
     logger.add(sys.stderr, level=level, format=LOG_FORMAT_CONSOLE)
 
     # 2. File Sink
-    settings.log_dir.mkdir(parents=True, exist_ok=True)
+    # `delay=True` postpones creating the log directory and opening the file
+    # until the first record is emitted, so CLI runs that log nothing skip it.
     log_file_path = settings.log_dir / "app.log"
     logger.add(
         log_file_path,
@@ -42,6 +43,7 @@ def setup_logging(verbose: bool = False) -> None:
         rotation=LOG_ROTATION,
         retention=LOG_RETENTION,
         compression=LOG_COMPRESSION,
+        delay=True,
     )
 
     logger.debug(f"Logging initialized. Logs saved to: {log_file_path}")
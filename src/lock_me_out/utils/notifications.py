@@ -1,60 +1,86 @@
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
+
 import pyfiglet
 from loguru import logger
 
 from lock_me_out.settings import settings
 
 
+# notify-send processes started but not yet waited for
+_pending_notifiers: list[subprocess.Popen] = []
+
+# The part of the notify-send command line that is the same for every call
+_NOTIFY_ARGS = ("-a", settings.app_name, "-i", settings.icon_path)
+
+
 def send_notification(summary: str, body: str):
-    """Sends a desktop notification using notify-send."""
-    logger.info(f"Sending notification: {summary} | {body}")
-    cmd = [
-        "notify-send",
-        summary,
-        body,
-        "-a",
-        settings.app_name,
-        "-i",
-        settings.icon_path,
-    ]
+    """
+    Sends a desktop notification using notify-send.
+
+    notify-send is started without waiting for it to finish; finished
+    processes are reaped on the next call so they don't linger as zombies.
+    """
+    global _pending_notifiers
+    _pending_notifiers = [p for p in _pending_notifiers if p.poll() is None]
+
+    logger.info("Sending notification: {} | {}", summary, body)
     try:
-        subprocess.run(cmd, check=False)
+        _pending_notifiers.append(
+            subprocess.Popen(
+                ["notify-send", summary, body, *_NOTIFY_ARGS],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
     except FileNotFoundError:
         logger.error("notify-send not found. Install libnotify-bin.")
     except Exception as e:
         logger.error(f"Failed to send notification: {e}")
 
 
+# Fullscreen launch prefixes for common terminals, in order of preference.
+# xterm is basic and might not render Rich colors well, but it's a fallback.
+_TERMINALS = (
+    # Use --start-as=fullscreen for modern kitty
+    ("kitty", "--start-as=fullscreen", "--title", "TOUCH GRASS"),
+    ("gnome-terminal", "--full-screen", "--"),
+    ("konsole", "--fullscreen", "-e"),
+    ("xfce4-terminal", "--fullscreen", "-e"),
+    ("xterm", "-fullscreen", "-e"),
+)
+
+# Debug log for the popup script's output, opened on first use
+_popup_log = None
+
+
+@lru_cache(maxsize=1)
+def _find_terminal() -> tuple[str, ...] | None:
+    """Returns the launch prefix of the first installed terminal, if any."""
+    for prefix in _TERMINALS:
+        if shutil.which(prefix[0]):
+            return prefix
+    return None
+
+
 def show_touch_grass_popup():
     """Opens a fullscreen terminal popup with a centered, styled message."""
+    global _popup_log
     try:
-        # The script to run is now the Python module that handles rendering
-        script_cmd = [sys.executable, "-m", "lock_me_out.utils.center_message"]
-
-        # Try common terminals with fullscreen/maximize flags
-        terminals = [
-            # Use --start-as=fullscreen for modern kitty
-            ["kitty", "--start-as=fullscreen", "--title", "TOUCH GRASS"] + script_cmd,
-            ["gnome-terminal", "--full-screen", "--"] + script_cmd,
-            ["konsole", "--fullscreen", "-e"] + script_cmd,
-            ["xfce4-terminal", "--fullscreen", "-e"] + script_cmd,
-            # xterm is basic and might not render Rich colors well, but it's a fallback
-            ["xterm", "-fullscreen", "-e"] + script_cmd,
-        ]
-
-        for cmd in terminals:
-            try:
-                # Check if the terminal exists first to avoid spamming errors
-                if subprocess.run(["which", cmd[0]], capture_output=True).returncode == 0:
-                    logger.info(f"Launching touch-grass popup via {cmd[0]}")
-                    # Log stdout/stderr to a file to debug the popup script
-                    with open("/tmp/popup_debug.log", "w") as log_file:
-                        subprocess.Popen(cmd, stdout=log_file, stderr=log_file)
-                    return
-            except Exception as e:
-                logger.debug(f"Failed to launch terminal {cmd[0]}: {e}")
-
-        logger.warning("No suitable terminal emulator found to show popup.")
+        prefix = _find_terminal()
+        if prefix is None:
+            logger.warning("No suitable terminal emulator found to show popup.")
+            return
+
+        # The script to run is the Python module that handles rendering
+        cmd = [*prefix, sys.executable, "-m", "lock_me_out.utils.center_message"]
+        logger.info("Launching touch-grass popup via {}", prefix[0])
+        if _popup_log is None:
+            # Log stdout/stderr to a file to debug the popup script
+            _popup_log = open("/tmp/popup_debug.log", "w")
+        subprocess.Popen(cmd, stdout=_popup_log, stderr=_popup_log)
     except Exception as e:
         logger.error(f"Error generating or showing touch-grass popup: {e}")
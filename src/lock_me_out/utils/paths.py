@@ -1,10 +1,17 @@
+from functools import lru_cache
 from pathlib import Path
 
 from platformdirs import user_data_dir, user_log_dir
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path | None:
-    """Returns the project root if running from source in a dev environment, else None."""
+    """
+    Returns the project root if running from source in a dev environment, else None.
+
+    The answer and the defaults below cannot change while the process runs,
+    so they are worked out once rather than on every Settings() construction.
+    """
     # We look for a .git directory or a specific marker to ensure we are in a dev repo
     # and not just installed in a way that happens to have a pyproject.toml 4 levels up.
     potential_root = Path(__file__).resolve().parent.parent.parent.parent
@@ -13,6 +20,7 @@ def get_project_root() -> Path | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def get_default_data_dir() -> Path:
     """Returns the default data directory (dev folder or XDG)."""
     root = get_project_root()
@@ -21,6 +29,7 @@ def get_default_data_dir() -> Path:
     return Path(user_data_dir(appname="lock_me_out"))
 
 
+@lru_cache(maxsize=1)
 def get_default_log_dir() -> Path:
     """Returns the default log directory (dev folder or XDG)."""
     root = get_project_root()
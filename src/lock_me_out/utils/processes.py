@@ -1,181 +1,321 @@
+import os
 import select
+import shutil
+import signal
 import subprocess
+import sys
 import threading
 import time
+from collections.abc import Callable, Collection
+from functools import lru_cache
 
 import psutil
 from loguru import logger
 
-from lock_me_out.utils.notifications import send_notification, show_touch_grass_popup
+from lock_me_out.utils.notifications import show_touch_grass_popup
 
+# The kernel truncates /proc/<pid>/comm to this many characters
+_COMM_LEN = 15
+_HAS_PROC = sys.platform.startswith("linux") and os.path.isdir("/proc")
+# Linux 5.1+; signals through a /proc/<pid> fd cannot hit a recycled PID
+_pidfd_send_signal = getattr(signal, "pidfd_send_signal", None)
 
-def kill_processes(process_names: list[str]):
-    """Kills a list of processes by name if they are running."""
-    killed_processes = set()
-    process_names_set = set(process_names)
 
-    for proc in psutil.process_iter(["name"]):
+def _read_at(dir_fd: int, name: str, size: int = 4096) -> bytes:
+    """Reads a small file relative to an open /proc/<pid> directory."""
+    fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _send_kill(dir_fd: int, pid: str) -> None:
+    """SIGKILLs the process behind an open /proc/<pid> directory."""
+    if _pidfd_send_signal is not None:
         try:
-            if proc.info["name"] in process_names_set:
-                logger.info(f"Killing {proc.info['name']} (PID: {proc.pid})")
-                proc.kill()
-                killed_processes.add(proc.info["name"])
+            _pidfd_send_signal(dir_fd, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            raise
+        except OSError:
+            pass  # Kernel too old for pidfd signals; fall back to kill(2)
+    os.kill(int(pid), signal.SIGKILL)
+
+
+def _full_name(dir_fd: int, comm: str) -> str:
+    """Recovers a name longer than comm allows from the process's argv[0]."""
+    try:
+        argv0 = _read_at(dir_fd, "cmdline").split(b"\0", 1)[0]
+    except OSError:
+        return comm
+    name = os.path.basename(argv0.decode(errors="replace"))
+    return name if name.startswith(comm) else comm
+
+
+@lru_cache(maxsize=8)
+def _truncated_names(process_names: frozenset[str]) -> frozenset[str]:
+    """The comm values the kernel would show for names too long to fit."""
+    return frozenset(n[:_COMM_LEN] for n in process_names if len(n) >= _COMM_LEN)
+
+
+def _kill_via_proc(process_names: Collection[str]) -> set[str]:
+    """
+    Kills matching processes by reading names straight from /proc.
+
+    Only each process's comm file is read, and argv[0] only when comm is
+    truncated and could belong to a blocked name; no psutil.Process objects
+    are built. Unless running as root, processes owned by other users
+    (kernel threads, system daemons) are skipped on a single stat, since
+    they could not be killed anyway. Matches are signalled through the
+    same /proc/<pid> descriptor their name was read from, so a PID reused
+    in between is never hit.
+    """
+    killed = set()
+    truncated = _truncated_names(frozenset(process_names))
+    uid = os.getuid()
+
+    for entry in os.scandir("/proc"):
+        pid = entry.name
+        if not pid.isdigit():
+            continue
+        try:
+            if uid and entry.stat().st_uid != uid:
+                continue
+            dir_fd = os.open(entry.path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+
+        try:
+            name = _read_at(dir_fd, "comm").rstrip(b"\n").decode(errors="replace")
+            if name not in process_names:
+                if name not in truncated:
+                    continue
+                name = _full_name(dir_fd, name)
+                if name not in process_names:
+                    continue
+
+            logger.info("Killing {} (PID: {})", name, pid)
+            _send_kill(dir_fd, pid)
+            killed.add(name)
+        except OSError:
+            continue
+        finally:
+            os.close(dir_fd)
+    return killed
+
+
+def _kill_via_psutil(process_names: Collection[str]) -> set[str]:
+    # Only the name is needed, so it is read directly rather than through
+    # process_iter(attrs), which builds an info dict per process
+    victims = []
+    for proc in psutil.process_iter():
+        try:
+            name = proc.name()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
+        if name in process_names:
+            victims.append((proc.pid, name))
+
+    # Signalled with kill(2) right after the walk; Process.kill() would
+    # re-read the process first to guard against PID reuse
+    killed = set()
+    for pid, name in victims:
+        logger.info("Killing {} (PID: {})", name, pid)
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            continue
+        killed.add(name)
+    return killed
+
+
+def kill_processes(process_names: Collection[str]) -> set[str]:
+    """
+    Kills a list of processes by name if they are running.
+
+    All names are matched in a single walk of the process table, via /proc
+    on Linux and psutil elsewhere. Pass a set or frozenset when calling
+    repeatedly to skip rebuilding one per call.
+
+    Returns the names that were killed; notifying the user is left to the
+    caller, which knows what it has already reported.
+    """
+    if not isinstance(process_names, (set, frozenset)):
+        process_names = set(process_names)
+
+    if _HAS_PROC:
+        return _kill_via_proc(process_names)
+    return _kill_via_psutil(process_names)
+
+
+# Absolute paths of the desktop helpers, resolved once; None if not installed
+_BINS = {
+    name: shutil.which(name)
+    for name in (
+        "xdg-screensaver",
+        "loginctl",
+        "gdbus",
+        "gnome-screensaver-command",
+        "dbus-monitor",
+    )
+}
 
-    for killed_name in killed_processes:
-        send_notification(f"Blocked {killed_name}", "App closed per schedule.")
 
+def _run_helper(*argv: str, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Runs a helper from _BINS by its absolute path.
+
+    With an absolute executable and close_fds=False, subprocess launches it
+    via os.posix_spawn rather than fork+exec; the daemon's own descriptors
+    are non-inheritable, so none leak into the child.
+    """
+    return subprocess.run(argv, close_fds=False, **kwargs)
+
+
+def _check_xdg_screensaver() -> bool:
+    result = _run_helper(
+        _BINS["xdg-screensaver"],
+        "status",
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+    return "is locked" in result.stdout
+
+
+def _check_loginctl() -> bool:
+    result = _run_helper(
+        _BINS["loginctl"],
+        "show-session",
+        "self",
+        "-p",
+        "LockedHint",
+        "--value",
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+    return result.stdout.strip() == "yes"
 
-_screen_lock_method_cache: str | None = None
+
+def _check_gdbus_gnome() -> bool:
+    """GNOME/Cinnamon/MATE screensaver, via gdbus."""
+    result = _run_helper(
+        _BINS["gdbus"],
+        "call",
+        "--session",
+        "--dest",
+        "org.gnome.ScreenSaver",
+        "--object-path",
+        "/org/gnome/ScreenSaver",
+        "--method",
+        "org.gnome.ScreenSaver.GetActive",
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+    return "(true,)" in result.stdout
+
+
+# Lock checks whose helper is installed, in the order they are tried until
+# one reports a locked screen
+_SCREEN_LOCK_CHECKERS: tuple[Callable[[], bool], ...] = tuple(
+    check
+    for name, check in (
+        ("xdg-screensaver", _check_xdg_screensaver),
+        ("loginctl", _check_loginctl),
+        ("gdbus", _check_gdbus_gnome),
+    )
+    if _BINS[name]
+)
+
+# The check that last reported a locked screen; it alone answers later calls
+_screen_lock_checker: Callable[[], bool] | None = None
 
 
 def is_screen_locked() -> bool:
     """Checks if the screen is locked using multiple methods."""
-    global _screen_lock_method_cache
+    global _screen_lock_checker
 
     # Prioritize cached method
-    if _screen_lock_method_cache == "xdg-screensaver":
-        try:
-            result = subprocess.run(
-                ["xdg-screensaver", "status"], capture_output=True, text=True, timeout=2
-            )
-            if "is locked" in result.stdout:
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            _screen_lock_method_cache = None  # Invalidate cache if it failed
-    elif _screen_lock_method_cache == "loginctl":
+    if _screen_lock_checker is not None:
         try:
-            result = subprocess.run(
-                ["loginctl", "show-session", "self", "-p", "LockedHint", "--value"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.stdout.strip() == "yes":
-                return True
+            return _screen_lock_checker()
         except (FileNotFoundError, subprocess.TimeoutExpired):
-            _screen_lock_method_cache = None  # Invalidate cache if it failed
-    elif _screen_lock_method_cache == "gdbus-gnome":
-        try:
-            result = subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.gnome.ScreenSaver",
-                    "--object-path",
-                    "/org/gnome/ScreenSaver",
-                    "--method",
-                    "org.gnome.ScreenSaver.GetActive",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if "(true,)" in result.stdout:
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            _screen_lock_method_cache = None
+            _screen_lock_checker = None  # Invalidate cache if it failed
 
     # Fallback to other methods if cached method failed or not set
-    if _screen_lock_method_cache is None:
-        # Method 1: xdg-screensaver
+    for checker in _SCREEN_LOCK_CHECKERS:
         try:
-            result = subprocess.run(
-                ["xdg-screensaver", "status"], capture_output=True, text=True, timeout=2
-            )
-            if "is locked" in result.stdout:
-                _screen_lock_method_cache = "xdg-screensaver"
+            if checker():
+                _screen_lock_checker = checker
                 return True
         except (FileNotFoundError, subprocess.TimeoutExpired):
             pass
 
-        # Method 2: loginctl
-        try:
-            result = subprocess.run(
-                ["loginctl", "show-session", "self", "-p", "LockedHint", "--value"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.stdout.strip() == "yes":
-                _screen_lock_method_cache = "loginctl"
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    return False
 
-        # Method 3: gdbus (GNOME/Cinnamon/MATE)
-        try:
-            result = subprocess.run(
-                [
-                    "gdbus",
-                    "call",
-                    "--session",
-                    "--dest",
-                    "org.gnome.ScreenSaver",
-                    "--object-path",
-                    "/org/gnome/ScreenSaver",
-                    "--method",
-                    "org.gnome.ScreenSaver.GetActive",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if "(true,)" in result.stdout:
-                _screen_lock_method_cache = "gdbus-gnome"
-                return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
 
-    return False
+# Lock commands whose helper is installed, in the order they are tried
+# until one can be run
+_SCREEN_LOCK_COMMANDS = tuple(
+    (_BINS[name], *args)
+    for name, *args in (
+        ("loginctl", "lock-session"),  # Modern systemd way
+        ("xdg-screensaver", "lock"),
+        ("gnome-screensaver-command", "-l"),  # GNOME/older systems
+    )
+    if _BINS[name]
+)
+
+_screen_lock_command_cache: tuple[str, ...] | None = None
 
+# Lock commands started but not yet waited for
+_pending_lockers: list[subprocess.Popen] = []
 
-_screen_lock_command_cache: list[str] | None = None
+
+def _start_locker(command: tuple[str, ...]) -> None:
+    """Starts a lock command without waiting for it (posix_spawn, as in _run_helper)."""
+    _pending_lockers.append(subprocess.Popen(command, close_fds=False))
 
 
 def lock_screen():
-    """Locks the screen using multiple methods."""
-    global _screen_lock_command_cache
+    """
+    Locks the screen using multiple methods.
+
+    The lock command is started without waiting for it to finish; the
+    caller re-checks is_screen_locked() anyway, and finished commands are
+    reaped on the next call so they don't linger as zombies. While one is
+    still running, no second locker is started.
+    """
+    global _screen_lock_command_cache, _pending_lockers
+    _pending_lockers = [p for p in _pending_lockers if p.poll() is None]
+    if _pending_lockers:
+        logger.debug("Lock command still running, not starting another.")
+        return
     logger.debug("Attempting to lock screen...")
 
     # Prioritize cached command
     if _screen_lock_command_cache:
         try:
-            subprocess.run(_screen_lock_command_cache, check=False)
+            _start_locker(_screen_lock_command_cache)
             return  # If cached command worked, we're done
         except FileNotFoundError:
             _screen_lock_command_cache = None  # Invalidate cache if it failed
 
     # Fallback to other methods if cached command failed or not set
-    # Method 1: loginctl (Modern systemd way)
-    try:
-        command = ["loginctl", "lock-session"]
-        subprocess.run(command, check=False)
+    for command in _SCREEN_LOCK_COMMANDS:
+        try:
+            _start_locker(command)
+        except FileNotFoundError:
+            continue
         _screen_lock_command_cache = command
         return
-    except FileNotFoundError:
-        pass
 
-    # Method 2: xdg-screensaver
-    try:
-        command = ["xdg-screensaver", "lock"]
-        subprocess.run(command, check=False)
-        _screen_lock_command_cache = command
-        return
-    except FileNotFoundError:
-        pass
 
-    # Method 3: gnome-screensaver-command (Specific for GNOME/older systems)
-    try:
-        command = ["gnome-screensaver-command", "-l"]
-        subprocess.run(command, check=False)
-        _screen_lock_command_cache = command
-        return
-    except FileNotFoundError:
-        pass
+# dbus-monitor's rendering of ActiveChanged's argument on unlock
+_UNLOCK_MARKER = b"boolean false"
 
 
 def wait_for_unlock(stop_event: threading.Event, timeout: float = 60.0):
@@ -184,7 +324,7 @@ def wait_for_unlock(stop_event: threading.Event, timeout: float = 60.0):
     Uses dbus-monitor to avoid polling if possible.
     Returns when screen is unlocked, timeout expires, or stop_event is set.
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
     proc = None
 
     # Try dbus-monitor for GNOME/MATE (ActiveChanged signal)
@@ -192,30 +332,45 @@ def wait_for_unlock(stop_event: threading.Event, timeout: float = 60.0):
     # We assume if is_screen_locked works via gdbus-gnome, this works too.
     try:
         # Monitoring generic GNOME screensaver signals
-        proc = subprocess.Popen(
-            [
-                "dbus-monitor",
-                "--session",
-                "type='signal',interface='org.gnome.ScreenSaver',member='ActiveChanged'",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True,
-            bufsize=1,  # Line buffered
-        )
+        if _BINS["dbus-monitor"]:
+            proc = subprocess.Popen(
+                [
+                    _BINS["dbus-monitor"],
+                    "--session",
+                    "type='signal',interface='org.gnome.ScreenSaver',member='ActiveChanged'",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                # Read raw: a Python-side buffer could hold lines select()
+                # can no longer see. dbus-monitor flushes after each message.
+                bufsize=0,
+                close_fds=False,
+            )
     except FileNotFoundError:
         proc = None
 
     if proc:
         logger.debug("Starting dbus-monitor to watch for unlock signal...")
+        fd = proc.stdout.fileno()
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        tail = b""
         try:
-            while not stop_event.is_set() and (time.time() - start_time < timeout):
-                # Check for output with timeout
-                rlist, _, _ = select.select([proc.stdout], [], [], 1.0)  # 1s timeout
-                if rlist:
-                    line = proc.stdout.readline()
+            while not stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Check for output, re-checking stop_event at least every
+                # second but never waiting past the deadline
+                if poller.poll(min(1000, int(remaining * 1000) + 1)):
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break  # dbus-monitor exited
+                    # Keep the end of the last read in case the marker spans two
+                    data = tail + chunk
+                    tail = data[-len(_UNLOCK_MARKER) :]
                     # GNOME emits ActiveChanged (boolean false) when unlocking
-                    if "boolean false" in line:
+                    if _UNLOCK_MARKER in data:
                         logger.info("D-Bus monitor detected screen unlock signal.")
                         show_touch_grass_popup()
                         # Allow 3 seconds for the user to read the fullscreen message
@@ -234,10 +389,7 @@ def wait_for_unlock(stop_event: threading.Event, timeout: float = 60.0):
             return
 
     # Fallback: Sleep if dbus-monitor not available or failed
-    # We loop for 'timeout' seconds, checking stop_event.
+    # Sleep out the rest of 'timeout' unless stop_event is set first.
     # The caller (manager) will re-check is_screen_locked() after this returns.
-    end_time = start_time + timeout
-    while not stop_event.is_set() and time.time() < end_time:
-        if stop_event.wait(timeout=2):
-            return
+    stop_event.wait(timeout=max(0.0, deadline - time.monotonic()))
 
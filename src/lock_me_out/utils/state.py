@@ -1,38 +1,67 @@
 import json
 import os
+import time
 from datetime import datetime
 
 from lock_me_out.settings import settings
+from lock_me_out.utils.files import write_atomic
 
 
-_last_written_state: dict | None = None
+# The last state written, serialised without last_update (which always
+# differs). A few hundred bytes, so comparing it beats hashing it.
+_last_written_payload: bytes | None = None
+# When it was written (monotonic), so last_update can be refreshed now and then
+_last_write_time = 0.0
+
+# An unchanged state is still rewritten this often, to keep last_update fresh
+_HEARTBEAT_SECS = 30.0
+
+# getpid() is a syscall on current glibc; look it up once per process
+_pid = os.getpid()
+
+
+def _reset_pid():
+    global _pid
+    _pid = os.getpid()
+
+
+os.register_at_fork(after_in_child=_reset_pid)
 
 
 def write_state(active_info=None):
     """Writes the current daemon state to a file for 'status' command."""
-    global _last_written_state
+    global _last_written_payload, _last_write_time
     state = {
-        "pid": os.getpid(),
-        "last_update": datetime.now().isoformat(),
+        "pid": _pid,
         "active_lockout": active_info,
     }
 
-    if state == _last_written_state:
-        return # No change, no need to write
+    payload = json.dumps(state, separators=(",", ":")).encode()
+    now = time.monotonic()
+    if payload == _last_written_payload and now - _last_write_time < _HEARTBEAT_SECS:
+        return  # No change, no need to write
 
+    # Splice last_update into the object already serialised above
+    data = payload[:-1] + b',"last_update":"%s"}' % datetime.now().isoformat().encode()
     try:
-        settings.data_dir.mkdir(parents=True, exist_ok=True)
-        with open(settings.state_file, "w") as f:
-            json.dump(state, f, indent=4)
-        _last_written_state = state
+        # Compact, in one write: only `lmout status` reads this file
+        try:
+            write_atomic(settings.state_file, data)
+        except FileNotFoundError:
+            # Create the data directory only when it is actually missing
+            settings.data_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(settings.state_file, data)
+        _last_written_payload = payload
+        _last_write_time = now
     except Exception:
         pass
 
 
 def cleanup_state():
     """Removes the state file when the daemon stops."""
-    if settings.state_file.exists():
-        try:
-            settings.state_file.unlink()
-        except Exception:
-            pass
+    global _last_written_payload
+    _last_written_payload = None
+    try:
+        settings.state_file.unlink(missing_ok=True)
+    except Exception:
+        pass
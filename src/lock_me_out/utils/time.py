@@ -1,20 +1,51 @@
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, time
+from functools import lru_cache
 
+# The accepted shapes, as strptime formats: %I%p, %I:%M%p, %H:%M, %H:%M:%S
+_TIME_RE = re.compile(r"([0-9]{1,2})(?::([0-9]{1,2})(?::([0-9]{1,2}))?)?(am|pm)?")
 
-def parse_time_string(time_str: str) -> datetime:
-    """Parses time strings like '8pm', '8:30pm', '20:00', '20:30'."""
-    formats = ["%I%p", "%I:%M%p", "%H:%M", "%H:%M:%S"]
+_SECOND_US = 1_000_000
+_DAY_US = 86_400 * _SECOND_US
+
+
+def _micros(t: time | datetime) -> int:
+    """Microseconds from midnight to t's time of day."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * _SECOND_US + t.microsecond
+
+
+@lru_cache(maxsize=256)
+def parse_clock_time(time_str: str) -> time:
+    """
+    Parses a time of day like '8pm', '8:30pm', '20:00', '20:30'.
+
+    Cached: schedules keep the same strings, and the daemon re-evaluates
+    every schedule on each tick, so each distinct string is parsed once.
+    One regex match replaces trying strptime format by format.
+    """
     time_str = time_str.lower().replace(" ", "")
-    now = datetime.now()
-    for fmt in formats:
+
+    m = _TIME_RE.fullmatch(time_str)
+    if m:
+        hour, minute, second, meridiem = m.groups()
         try:
-            parsed_time = datetime.strptime(time_str, fmt).time()
-            return datetime.combine(now.date(), parsed_time)
+            if meridiem:
+                # 12-hour clock: 1-12, no seconds; 12am is midnight
+                if second is None and 1 <= int(hour) <= 12:
+                    offset = 12 if meridiem == "pm" else 0
+                    return time(int(hour) % 12 + offset, int(minute or 0))
+            elif minute is not None:
+                return time(int(hour), int(minute), int(second or 0))
         except ValueError:
-            continue
+            pass  # Out-of-range minute or second
     raise ValueError(f"Could not parse time: {time_str}")
 
 
+def parse_time_string(time_str: str) -> datetime:
+    """Parses time strings like '8pm', '8:30pm', '20:00', '20:30' as today's date."""
+    return datetime.combine(datetime.now().date(), parse_clock_time(time_str))
+
+
 def format_duration_seconds(seconds: int) -> str:
     """
     Formats a duration in seconds into a human-readable string (e.g., '2h 30m' or '45m').
@@ -40,33 +71,31 @@ def calculate_from_range(
     if now is None:
         now = datetime.now()
 
-    start_dt = parse_time_string(start_str)
-    end_dt = parse_time_string(end_str)
-
-    # Ensure start/end match the reference date
-    start_dt = datetime.combine(now.date(), start_dt.time())
-    end_dt = datetime.combine(now.date(), end_dt.time())
+    # Work in microseconds since the reference date's midnight, which is
+    # what anchoring start/end to that date with datetime.combine amounts
+    # to, without building and subtracting datetimes
+    start = _micros(parse_clock_time(start_str))
+    end = _micros(parse_clock_time(end_str))
+    now_us = _micros(now)
 
     # If end is before start, assume end is tomorrow
-    if end_dt <= start_dt:
-        end_dt += timedelta(days=1)
+    if end <= start:
+        end += _DAY_US
 
-    total_duration_seconds = int((end_dt - start_dt).total_seconds())
+    total_duration_seconds = (end - start) // _SECOND_US
 
     # Logic for when to start
-    if start_dt < now and end_dt > now:
+    if start < now_us < end:
         # We are already in the time range, start immediately
         delay_seconds = 0
-        duration_seconds = max(1, int((end_dt - now).total_seconds()))
-    elif start_dt >= now:
+        duration_seconds = max(1, (end - now_us) // _SECOND_US)
+    elif start >= now_us:
         # Start in the future
-        delay_seconds = int((start_dt - now).total_seconds())
+        delay_seconds = (start - now_us) // _SECOND_US
         duration_seconds = total_duration_seconds
     else:
         # Both start and end in the past, assume tomorrow
-        start_dt += timedelta(days=1)
-        end_dt += timedelta(days=1)
-        delay_seconds = int((start_dt - now).total_seconds())
+        delay_seconds = (start + _DAY_US - now_us) // _SECOND_US
         duration_seconds = total_duration_seconds
 
     return delay_seconds, duration_seconds, total_duration_seconds
@@ -0,0 +1,78 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_EVENT = struct.Struct("iIII")
+
+
+class DirectoryWatcher:
+    """
+    Watches a directory with inotify for files being written or moved in.
+
+    The watcher is a file descriptor that becomes readable when one of the
+    watched names changes, so it can sit in the same select() as sockets.
+    """
+
+    def __init__(self, directory: Path, names: set[str]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.names = names
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def read(self) -> set[str]:
+        """Drains pending events and returns which watched names changed."""
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buf):
+                _, _, _, name_len = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset : offset + name_len].rstrip(b"\0").decode()
+                offset += name_len
+                if name in self.names:
+                    changed.add(name)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def watch_directory(directory: Path, names: set[str]) -> DirectoryWatcher | None:
+    """
+    Returns a watcher for names in directory.
+
+    Returns None where inotify is unavailable, so callers fall back to polling.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        return DirectoryWatcher(directory, names)
+    except (OSError, AttributeError) as e:
+        logger.warning(f"inotify unavailable, falling back to polling: {e}")
+        return None
@@ -0,0 +1,9 @@
+import pytest
+
+from lock_me_out.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_log_dir(tmp_path, monkeypatch):
+    # Keeps the file sink set up by CLI commands out of the checkout
+    monkeypatch.setattr(settings, "log_dir", tmp_path / "logs")
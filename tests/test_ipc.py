@@ -0,0 +1,115 @@
+import os
+import threading
+
+import pytest
+
+from lock_me_out import daemon
+from lock_me_out.utils.ipc import (
+    hold_daemon_lock,
+    is_daemon_lock_held,
+    open_command_socket,
+    send_command,
+)
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = tmp_path / "command.sock"
+    sock = open_command_socket(path)
+    yield path, sock
+    sock.close()
+
+
+def _send_in_background(path, command):
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(accepted=send_command(path, command))
+    )
+    thread.start()
+    return thread, result
+
+
+def _process_when_ready(sock, busy):
+    import select
+
+    select.select([sock], [], [], 2)
+    return daemon._process_commands(sock, busy)
+
+
+def test_stop_command_is_acked(server):
+    path, sock = server
+    thread, result = _send_in_background(
+        path, {"command": "stop_lockout", "schedule_id": "abc"}
+    )
+
+    command = _process_when_ready(sock, busy=True)
+    thread.join(2)
+
+    assert command.kind is daemon.Cmd.STOP
+    assert command.extra["schedule_id"] == "abc"
+    assert result["accepted"] is True
+
+
+def test_instant_rejected_while_busy(server):
+    path, sock = server
+    thread, result = _send_in_background(path, {"command": "start_instant"})
+
+    command = _process_when_ready(sock, busy=True)
+    thread.join(2)
+
+    assert command is daemon.NO_COMMAND
+    assert result["accepted"] is False
+
+
+def test_send_without_daemon_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        send_command(tmp_path / "missing.sock", {"command": "stop_lockout"})
+
+
+def test_daemon_lock_held_only_while_open(tmp_path):
+    path = tmp_path / "daemon.lock"
+    assert not is_daemon_lock_held(path)
+
+    fd = hold_daemon_lock(path)
+    assert is_daemon_lock_held(path)
+
+    os.close(fd)
+    assert not is_daemon_lock_held(path)
+
+
+def test_reload_command_is_acked(server):
+    path, sock = server
+    thread, result = _send_in_background(path, {"command": "reload"})
+
+    assert _process_when_ready(sock, busy=False) is daemon.NO_COMMAND
+    thread.join(2)
+
+    assert result["accepted"] is True
+
+
+@pytest.mark.parametrize(
+    "next_delay, expected",
+    [
+        (None, 300),
+        (3 * 3600, 300),
+        (180 + 30 + 100, 100),
+        (60, 5),
+    ],
+)
+def test_idle_sleep_tracks_next_schedule(next_delay, expected):
+    assert daemon._idle_sleep(next_delay, lead_secs=180) == expected
+
+
+def test_legacy_command_file_is_consumed(tmp_path, monkeypatch):
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    assert daemon._read_command_file() is None
+
+    settings.command_file.write_bytes(b'{"command": "stop_lockout"}')
+    assert daemon._read_command_file() == {"command": "stop_lockout"}
+    assert not settings.command_file.exists()
+
+    settings.command_file.write_bytes(b"{not json")
+    assert daemon._read_command_file() is None
+    assert not settings.command_file.exists()
@@ -0,0 +1,90 @@
+from lock_me_out.manager import LockOutManager
+
+
+def test_idle_event_tracks_session_lifecycle():
+    manager = LockOutManager(0, 1)
+    assert manager.idle_event.is_set()
+
+    manager.start(block_only=True)
+    assert not manager.idle_event.is_set()
+
+    assert manager.idle_event.wait(timeout=5)
+    assert manager.get_status().state == "IDLE"
+
+
+def test_stop_sets_idle_event():
+    manager = LockOutManager(60, 60)
+    manager.start(block_only=True)
+    manager.stop()
+
+    assert manager.idle_event.is_set()
+
+
+def test_wakeup_fd_readable_only_while_idle():
+    import select
+
+    manager = LockOutManager(60, 60)
+    assert select.select([manager], [], [], 0)[0] == [manager]
+
+    manager.start(block_only=True)
+    assert select.select([manager], [], [], 0)[0] == []
+
+    manager.stop()
+    assert select.select([manager], [], [], 0)[0] == [manager]
+
+
+def test_one_minute_warning_sent_before_lockout(monkeypatch):
+    import threading
+
+    from lock_me_out import manager as manager_module
+
+    warned = threading.Event()
+
+    def notify(summary, body):
+        if summary.startswith("1 minute"):
+            warned.set()
+
+    monkeypatch.setattr(manager_module, "send_notification", notify)
+
+    manager = LockOutManager(60.2, 60)
+    manager.start(block_only=True)
+    try:
+        assert warned.wait(timeout=5)
+        assert manager.get_status().state == "WAITING"
+    finally:
+        manager.stop()
+
+
+def test_remaining_time_ignores_wall_clock_jumps(monkeypatch):
+    import time
+
+    manager = LockOutManager(600, 60)
+    manager.start(block_only=True)
+    try:
+        monkeypatch.setattr(time, "time", lambda: 0.0)
+        status = manager.get_status()
+        assert 590 <= status.time_remaining <= 600
+        # The reported end moves with the wall clock, not the deadline
+        assert 590 <= status.ends_at <= 600
+    finally:
+        manager.stop()
+
+
+def test_repeat_kills_notified_once_per_interval(monkeypatch):
+    from lock_me_out import manager as manager_module
+
+    sent = []
+    monkeypatch.setattr(
+        manager_module, "send_notification", lambda summary, body: sent.append(summary)
+    )
+    clock = [1000.0]
+    monkeypatch.setattr(manager_module.time, "monotonic", lambda: clock[0])
+
+    manager = LockOutManager(0, 60)
+    manager._notify_kills({"chrome"})
+    clock[0] += 2
+    manager._notify_kills({"chrome", "code"})
+    clock[0] += 61
+    manager._notify_kills({"chrome", "code"})
+
+    assert sent == ["Blocked chrome", "Blocked code", "Blocked apps"]
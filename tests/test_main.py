@@ -0,0 +1,270 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from lock_me_out import cli
+
+
+def test_command_table_covers_registered_commands():
+    assert set(cli._commands()) == {
+        "add",
+        "instant",
+        "list",
+        "unskip",
+        "remove",
+        "force-remove",
+        "config",
+        "status",
+        "start",
+    }
+
+
+def test_dispatch_builds_only_the_invoked_command(monkeypatch, capsys):
+    def fail(*args, **kwargs):
+        raise AssertionError("full app should not be built")
+
+    cli._commands()
+    monkeypatch.setattr(cli, "app", fail)
+
+    with pytest.raises(SystemExit) as exc:
+        cli.dispatch(["add", "--help"])
+
+    assert exc.value.code == 0
+    assert "lmout add" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "apps, expected",
+    [
+        (None, []),
+        ([], []),
+        (["chrome"], ["chrome"]),
+        ([" chrome "], ["chrome"]),
+        (["chrome, code", "nvim"], ["chrome", "code", "nvim"]),
+        (["chrome,,", " ,code"], ["chrome", "code"]),
+        (["google chrome ", "code"], ["google chrome", "code"]),
+    ],
+)
+def test_process_apps_list(apps, expected):
+    assert cli.process_apps_list(apps) == expected
+
+
+def test_is_pid_alive():
+    assert cli._is_pid_alive(os.getpid())
+    assert not cli._is_pid_alive(2**22 + 1)  # above the kernel's pid_max
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open is Linux-only")
+def test_is_pid_alive_sees_exited_child():
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+    try:
+        # Give the child time to exit; it stays a zombie until reaped.
+        for _ in range(100):
+            if not cli._is_pid_alive(pid):
+                break
+            time.sleep(0.01)
+        assert not cli._is_pid_alive(pid)
+    finally:
+        os.waitpid(pid, 0)
+
+
+@pytest.mark.parametrize("argv", [[], ["--help"], ["-h"]])
+def test_top_level_help_skips_typer(monkeypatch, capsys, argv):
+    def fail(*args, **kwargs):
+        raise AssertionError("full app should not be built")
+
+    monkeypatch.setattr(cli.typer.Typer, "__call__", fail)
+
+    cli.dispatch(argv)
+
+    out = capsys.readouterr().out
+    assert "Usage: lmout COMMAND" in out
+    assert "force-remove" in out
+
+
+@pytest.mark.parametrize(
+    "delay_secs, expected",
+    [
+        (0, "NOW"),
+        (45, "45s"),
+        (60, "1m"),
+        (59 * 60 + 59, "59m"),
+        (3600, "1h 0m"),
+        (2 * 3600 + 5 * 60, "2h 5m"),
+    ],
+)
+def test_fmt_delay(delay_secs, expected):
+    assert cli._fmt_delay(delay_secs) == expected
+
+
+@pytest.mark.parametrize(
+    "rem_secs, phase, expected",
+    [
+        (30, "WAITING", "Starts in 30s"),
+        (60, "WAITING", "Starts in 60s"),
+        (125, "WAITING", "Starts in 2m"),
+        (600, "LOCKED", "Ends in 10m"),
+        (600, None, "N/A"),
+        (600, "IDLE", "N/A"),
+    ],
+)
+def test_format_countdown(rem_secs, phase, expected):
+    assert cli._format_countdown(rem_secs, phase) == expected
+
+
+def test_remaining_secs_counts_down_to_reported_end(monkeypatch):
+    monkeypatch.setattr(cli.time, "time", lambda: 1000.0)
+    assert cli._remaining_secs({"ends_at": 1090}) == 90
+    assert cli._remaining_secs({"ends_at": 900}) == 0
+    assert cli._remaining_secs({"remaining_secs": 42}) == 42
+
+
+def test_remove_uses_numbering_from_last_list(tmp_path, monkeypatch):
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    now = datetime.now()
+    later = (now + timedelta(hours=2)).strftime("%H:%M")
+    sooner = (now + timedelta(hours=1)).strftime("%H:%M")
+    end = (now + timedelta(hours=3)).strftime("%H:%M")
+
+    sm = ScheduleManager()
+    sm.add_schedule(later, end, "later")
+    sm.add_schedule(sooner, end, "sooner")
+
+    with pytest.raises(SystemExit):
+        cli.dispatch(["list"])
+    with pytest.raises(SystemExit):
+        cli.dispatch(["remove", "1"])
+
+    remaining = ScheduleManager().schedules
+    assert [s.description for s in remaining] == ["sooner"]
+
+
+def test_remove_without_list_index_numbers_like_list(tmp_path, monkeypatch):
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    now = datetime.now()
+    later = (now + timedelta(hours=2)).strftime("%H:%M")
+    sooner = (now + timedelta(hours=1)).strftime("%H:%M")
+    end = (now + timedelta(hours=3)).strftime("%H:%M")
+
+    sm = ScheduleManager()
+    sm.add_schedule(later, end, "later")
+    sm.add_schedule(sooner, end, "sooner")
+    sm.skip_schedule_today(sm.schedules[0].id)
+    assert not settings.list_index_file.exists()
+
+    # `list` would show the skipped "later" schedule as 1
+    with pytest.raises(SystemExit):
+        cli.dispatch(["remove", "1"])
+
+    remaining = ScheduleManager().schedules
+    assert [s.description for s in remaining] == ["sooner"]
+
+
+@pytest.mark.parametrize(
+    ("from_schedule", "expected"), [(True, "Ends in 10m"), (False, "N/A")]
+)
+def test_list_countdown_fallback_per_row_kind(
+    tmp_path, monkeypatch, capsys, from_schedule, expected
+):
+    import json
+
+    from rich.console import Console
+
+    from lock_me_out.manager import ScheduleManager
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(cli.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(cli, "_console", lambda: Console(width=200))
+    now = datetime.now()
+    sm = ScheduleManager()
+    sm.add_schedule(
+        (now + timedelta(hours=1)).strftime("%H:%M"),
+        (now + timedelta(hours=2)).strftime("%H:%M"),
+    )
+    active = {"current_phase": None, "ends_at": 1600, "source": "instant"}
+    if from_schedule:
+        active["schedule_id"] = str(sm.schedules[0].id)
+    settings.state_file.write_text(json.dumps({"active_lockout": active}))
+
+    with pytest.raises(SystemExit):
+        cli.dispatch(["list"])
+
+    assert expected in capsys.readouterr().out
+
+
+def test_config_reports_no_changes_without_saving(tmp_path, monkeypatch, capsys):
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    # load_settings() locates config.json from the environment
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(cli, "_notify_daemon", lambda: None)
+
+    with pytest.raises(SystemExit):
+        cli.dispatch(["config"])
+    assert "No changes." in capsys.readouterr().out
+    assert not (tmp_path / "config.json").exists()
+
+    with pytest.raises(SystemExit):
+        cli.dispatch(["config", "--lead", "7"])
+    assert "Configuration saved!" in capsys.readouterr().out
+    assert (tmp_path / "config.json").exists()
+
+
+def test_read_state_cached_until_file_changes(tmp_path, monkeypatch):
+    import json
+
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    assert cli._read_state() == {}
+
+    settings.state_file.write_text(json.dumps({"pid": 1}))
+    first = cli._read_state()
+    assert cli._read_state() is first
+
+    settings.state_file.write_text(json.dumps({"pid": 2}))
+    st = settings.state_file.stat()
+    os.utime(settings.state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cli._read_state() == {"pid": 2}
+
+
+def test_legacy_command_refuses_to_overwrite_pending(tmp_path, monkeypatch):
+    import json
+
+    import typer
+
+    from lock_me_out.settings import settings
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    assert cli._send_command({"command": "stop_lockout"}, legacy=True)
+    with pytest.raises(typer.Exit):
+        cli._send_command({"command": "start_instant"}, legacy=True)
+
+    assert json.loads(settings.command_file.read_text()) == {"command": "stop_lockout"}
+    assert not settings.command_file.with_suffix(".tmp").exists()
+
+
+def test_status_skips_systemctl_without_daemon_lock(tmp_path, monkeypatch, capsys):
+    from lock_me_out.settings import settings
+
+    calls = []
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(cli, "_systemctl", lambda *args, **kw: calls.append(args))
+
+    cli.status(verbose=False)
+
+    assert calls == []
+    assert "Stopped" in capsys.readouterr().out
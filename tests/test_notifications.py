@@ -0,0 +1,50 @@
+from lock_me_out.settings import settings
+from lock_me_out.utils import notifications
+
+
+class FakePopen:
+    def __init__(self, cmd, **kwargs):
+        self.cmd = cmd
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+
+def test_send_notification_does_not_wait_and_reaps_finished(monkeypatch):
+    monkeypatch.setattr(notifications.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(notifications, "_pending_notifiers", [])
+
+    notifications.send_notification("first", "body")
+    (first,) = notifications._pending_notifiers
+    assert first.cmd[:3] == ["notify-send", "first", "body"]
+    assert first.cmd[3:] == ["-a", settings.app_name, "-i", settings.icon_path]
+
+    first.returncode = 0
+    notifications.send_notification("second", "body")
+    assert [p.cmd[1] for p in notifications._pending_notifiers] == ["second"]
+
+
+def test_terminal_discovery_is_cached(monkeypatch):
+    looked_up = []
+
+    def fake_which(name):
+        looked_up.append(name)
+        return "/usr/bin/konsole" if name == "konsole" else None
+
+    monkeypatch.setattr(notifications.shutil, "which", fake_which)
+    notifications._find_terminal.cache_clear()
+    try:
+        assert notifications._find_terminal()[0] == "konsole"
+        assert notifications._find_terminal()[0] == "konsole"
+        assert looked_up == ["kitty", "gnome-terminal", "konsole"]
+    finally:
+        notifications._find_terminal.cache_clear()
+
+
+def test_popup_art_matches_figlet_rendering():
+    import pyfiglet
+
+    from lock_me_out.utils.center_message import ART_TEXT
+
+    assert ART_TEXT == pyfiglet.Figlet(font="block").renderText("TOUCH GRASS")
@@ -0,0 +1,136 @@
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from lock_me_out.utils import processes
+
+
+class FakeProc:
+    def __init__(self, pid, name):
+        self.pid = pid
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+def test_kill_processes_walks_process_table_once(monkeypatch):
+    procs = [FakeProc(1, "code"), FakeProc(2, "bash"), FakeProc(3, "nvim")]
+    walks = []
+    signalled = []
+
+    def process_iter():
+        walks.append(True)
+        return iter(procs)
+
+    monkeypatch.setattr(processes, "_HAS_PROC", False)
+    monkeypatch.setattr(processes.psutil, "process_iter", process_iter)
+    monkeypatch.setattr(processes.os, "kill", lambda pid, sig: signalled.append(pid))
+
+    killed = processes.kill_processes(frozenset({"code", "nvim", "chrome"}))
+
+    assert len(walks) == 1
+    assert signalled == [1, 3]
+    assert killed == {"code", "nvim"}
+
+
+@pytest.mark.skipif(not processes._HAS_PROC, reason="needs /proc")
+@pytest.mark.parametrize("use_pidfd", [True, False])
+def test_kill_via_proc_matches_names_longer_than_comm(tmp_path, monkeypatch, use_pidfd):
+    # comm is the basename of the executed path, truncated to 15 characters
+    name = "lmout-test-sleeper-long"
+    exe = tmp_path / name
+    os.symlink("/bin/sleep", exe)
+    proc = subprocess.Popen([str(exe), "30"])
+    for _ in range(200):
+        # Popen can return before the child has finished exec()
+        with open(f"/proc/{proc.pid}/comm") as f:
+            if f.read().strip() == name[:15]:
+                break
+        time.sleep(0.01)
+    if not use_pidfd:
+        monkeypatch.setattr(processes, "_pidfd_send_signal", None)
+
+    try:
+        killed = processes.kill_processes([name])
+        assert proc.wait(timeout=5) == -9
+    finally:
+        proc.kill()
+
+    assert killed == {name}
+
+
+def test_screen_lock_check_remembers_the_method_that_answered(monkeypatch):
+    calls = []
+
+    def missing():
+        calls.append("missing")
+        raise FileNotFoundError
+
+    def unlocked():
+        calls.append("unlocked")
+        return False
+
+    def locked():
+        calls.append("locked")
+        return True
+
+    monkeypatch.setattr(processes, "_SCREEN_LOCK_CHECKERS", (missing, unlocked, locked))
+    monkeypatch.setattr(processes, "_screen_lock_checker", None)
+
+    assert processes.is_screen_locked()
+    assert calls == ["missing", "unlocked", "locked"]
+
+    calls.clear()
+    assert processes.is_screen_locked()
+    assert calls == ["locked"]
+
+
+def test_lock_screen_waits_for_running_locker(monkeypatch):
+    started = []
+
+    class RunningLocker:
+        returncode = None
+
+        def __init__(self, command, **kwargs):
+            started.append(command)
+
+        def poll(self):
+            return self.returncode
+
+    monkeypatch.setattr(processes.subprocess, "Popen", RunningLocker)
+    monkeypatch.setattr(processes, "_pending_lockers", [])
+    monkeypatch.setattr(processes, "_screen_lock_command_cache", ("lock",))
+
+    processes.lock_screen()
+    processes.lock_screen()
+    assert started == [("lock",)]
+
+    processes._pending_lockers[0].returncode = 0
+    processes.lock_screen()
+    assert started == [("lock",), ("lock",)]
+
+
+def test_wait_for_unlock_sees_marker_after_first_line(tmp_path, monkeypatch):
+    # The marker arrives on the second line of a single write, as
+    # dbus-monitor prints a signal and its argument together
+    monitor = tmp_path / "dbus-monitor"
+    monitor.write_text(
+        "#!/bin/sh\n"
+        "printf 'signal member=ActiveChanged\\n   boolean false\\n'\n"
+        "sleep 30\n"
+    )
+    monitor.chmod(0o755)
+    popups = []
+    monkeypatch.setitem(processes._BINS, "dbus-monitor", str(monitor))
+    monkeypatch.setattr(processes, "show_touch_grass_popup", lambda: popups.append(1))
+    monkeypatch.setattr(processes.time, "sleep", lambda s: None)
+
+    start = time.monotonic()
+    processes.wait_for_unlock(threading.Event(), timeout=5)
+
+    assert popups == [1]
+    assert time.monotonic() - start < 2
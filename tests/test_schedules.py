@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from pathlib import Path
 from uuid import UUID
 from lock_me_out.manager import ScheduleManager
@@ -39,3 +40,137 @@ def test_schedule_manager_remove(tmp_path):
     assert len(manager.schedules) == 0
 
     settings.data_dir = original_data_dir
+
+
+def test_load_skipped_after_own_save(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    added = manager.add_schedule("8pm", "9pm")
+    manager._load_schedules()
+    assert manager.schedules[0] is added  # not re-parsed from disk
+
+    # Another process rewriting the file is still picked up
+    other = ScheduleManager()
+    other.add_schedule("10pm", "11pm")
+    st = manager.schedules_file.stat()
+    os.utime(manager.schedules_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    manager._load_schedules()
+    assert len(manager.schedules) == 2
+
+
+def test_lookup_by_id_follows_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    s = manager.add_schedule("8pm", "9pm")
+    assert manager.get_schedule(s.id) is s
+    assert manager.get_schedule(str(s.id)) is s
+    assert manager.get_schedule("not-a-uuid") is None
+
+    assert ScheduleManager().get_schedule(str(s.id)) == s
+
+    manager.remove_schedule(str(s.id))
+    assert manager.get_schedule(s.id) is None
+    assert manager.schedules == []
+
+
+def test_check_schedules_uses_one_reference_time(tmp_path, monkeypatch):
+    from datetime import datetime
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    manager.add_schedule("9pm", "10pm")
+    manager.add_schedule("8pm", "9pm")
+    now = datetime(2024, 1, 1, 19, 0)
+
+    candidates = manager.check_schedules(now=now)
+
+    assert [c[0].start_time for c in candidates] == ["8pm", "9pm"]
+    assert [c[1] for c in candidates] == [3600, 7200]
+    assert manager.next_schedule(now=now) == candidates[0]
+
+    manager.skip_schedule_today(candidates[0][0].id)
+    manager.skip_schedule_today(candidates[1][0].id)
+    assert manager.next_schedule(now=datetime.now()) is None
+
+
+def test_missing_file_is_remembered(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    empty = manager.schedules
+    manager._load_schedules()
+    assert manager.schedules is empty  # not rebuilt while still missing
+
+    ScheduleManager().add_schedule("8pm", "9pm")
+    manager._load_schedules()
+    assert len(manager.schedules) == 1
+
+    manager.schedules_file.unlink()
+    manager._load_schedules()
+    assert manager.schedules == []
+
+
+def test_remove_unknown_id_does_not_save(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    manager.remove_schedule("00000000-0000-0000-0000-000000000000")
+    manager.update_schedule(LockSchedule(start_time="8pm", end_time="9pm"))
+
+    assert not manager.schedules_file.exists()
+
+
+def test_unchanged_schedules_are_not_rewritten(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    manager.add_schedule("8pm", "9pm")
+    mtime_ns = manager.schedules_file.stat().st_mtime_ns
+
+    manager.save_schedules()
+    assert manager.schedules_file.stat().st_mtime_ns == mtime_ns
+
+    # A file deleted behind our back is written again
+    manager.schedules_file.unlink()
+    manager.save_schedules()
+    assert manager.schedules_file.exists()
+
+
+def test_skip_today_drops_past_skipped_dates(tmp_path, monkeypatch):
+    from datetime import date
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    s = manager.add_schedule("8pm", "9pm", persist=True)
+    manager.update_schedule(
+        s.model_copy(update={"skipped_dates": ("2000-01-01", "2000-01-02")})
+    )
+
+    manager.skip_schedule_today(s.id)
+
+    assert ScheduleManager().get_schedule(s.id).skipped_dates == (
+        date.today().isoformat(),
+    )
+
+
+def test_schedules_change_only_through_the_manager(tmp_path, monkeypatch):
+    from pydantic import ValidationError
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    manager = ScheduleManager()
+    s = manager.add_schedule("8pm", "9pm")
+    with pytest.raises(ValidationError):
+        s.enabled = False
+
+    manager.skip_schedule_today(s.id)
+    assert manager.schedules == [manager.get_schedule(s.id)]
+    assert manager.get_schedule(s.id).skipped_dates
+    assert not s.skipped_dates
+
+    manager.reset_skipped_schedules()
+    assert not ScheduleManager().get_schedule(s.id).skipped_dates
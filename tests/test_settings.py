@@ -0,0 +1,59 @@
+import json
+import os
+
+from lock_me_out.settings import load_settings
+
+
+def test_load_settings_cached_until_config_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"notify_lead_minutes": 7}))
+
+    first = load_settings()
+    assert first.notify_lead_minutes == 7
+    assert load_settings() is first
+
+    config_path.write_text(json.dumps({"notify_lead_minutes": 9}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_settings()
+    assert second is not first
+    assert second.notify_lead_minutes == 9
+
+
+def test_buffered_saves_once_and_only_on_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    settings = load_settings()
+    config_path = tmp_path / "config.json"
+
+    with settings.buffered():
+        pass
+    assert not config_path.exists()
+
+    with settings.buffered() as s:
+        s.notify_lead_minutes = 11
+        s.blocked_apps = ["code"]
+    saved = json.loads(config_path.read_text())
+    assert saved["notify_lead_minutes"] == 11
+    assert saved["blocked_apps"] == ["code"]
+
+
+def test_env_file_read_once_and_below_environment(tmp_path, monkeypatch):
+    from lock_me_out.settings import _dotenv_source
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    (tmp_path / ".env").write_text("NOTIFY_LEAD_MINUTES=7\nAPP_NAME=from_env_file\n")
+    _dotenv_source.cache_clear()
+    try:
+        assert load_settings().notify_lead_minutes == 7
+
+        (tmp_path / ".env").write_text("NOTIFY_LEAD_MINUTES=8\n")
+        assert load_settings().notify_lead_minutes == 7
+
+        monkeypatch.setenv("NOTIFY_LEAD_MINUTES", "9")
+        assert load_settings().notify_lead_minutes == 9
+        assert load_settings().app_name == "from_env_file"
+    finally:
+        _dotenv_source.cache_clear()
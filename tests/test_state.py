@@ -0,0 +1,47 @@
+import json
+
+from lock_me_out.settings import settings
+from lock_me_out.utils import state as state_module
+
+
+def test_unchanged_state_is_not_rewritten(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(state_module, "_last_written_payload", None)
+
+    state_module.write_state()
+    first = settings.state_file.stat()
+    state_module.write_state()
+    assert settings.state_file.stat().st_ino == first.st_ino
+
+    state_module.write_state({"source": "instant", "remaining_secs": 5})
+    assert settings.state_file.stat().st_ino != first.st_ino
+    written = json.loads(settings.state_file.read_bytes())
+    assert written["active_lockout"]["remaining_secs"] == 5
+    assert "last_update" in written
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_state_creates_missing_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path / "data")
+    monkeypatch.setattr(state_module, "_last_written_payload", None)
+
+    state_module.write_state()
+    assert json.loads(settings.state_file.read_bytes())["active_lockout"] is None
+
+
+def test_unchanged_state_is_refreshed_after_heartbeat(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(state_module, "_last_written_payload", None)
+    clock = [1000.0]
+    monkeypatch.setattr(state_module.time, "monotonic", lambda: clock[0])
+
+    state_module.write_state({"ends_at": 1234})
+    first = settings.state_file.stat().st_ino
+
+    clock[0] += state_module._HEARTBEAT_SECS - 1
+    state_module.write_state({"ends_at": 1234})
+    assert settings.state_file.stat().st_ino == first
+
+    clock[0] += 1
+    state_module.write_state({"ends_at": 1234})
+    assert settings.state_file.stat().st_ino != first
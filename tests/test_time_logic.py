@@ -10,6 +10,8 @@ def test_parse_time_string():
     assert parse_time_string("8:30pm").time() == time(20, 30)
     assert parse_time_string("20:00").time() == time(20, 0)
     assert parse_time_string("08:00").time() == time(8, 0)
+    assert parse_time_string("20:30:15").time() == time(20, 30, 15)
+    assert parse_time_string("8 PM").time() == time(20, 0)
 
     with pytest.raises(ValueError):
         parse_time_string("invalid")
@@ -47,3 +49,64 @@ def test_calculate_from_range_already_in_range():
     # If start is 1 hour ago and end is 1 hour from now
     # This is hard to test without mocking now.
     pass
+
+
+def test_calculate_from_range_parses_each_string_once():
+    from lock_me_out.utils.time import parse_clock_time
+
+    parse_clock_time.cache_clear()
+    now = datetime(2024, 1, 1, 10, 0)
+    for _ in range(3):
+        calculate_from_range("8pm", "9:30pm", now=now)
+
+    info = parse_clock_time.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+@pytest.mark.parametrize(
+    "start, end, now, expected",
+    [
+        # Inside the range, with sub-second precision truncated
+        ("10:00", "11:00", time(10, 30, 0, 500_000), (0, 1799, 3600)),
+        # Exactly at the start counts as upcoming
+        ("10:00", "11:00", time(10, 0), (0, 3600, 3600)),
+        # Exactly at the end rolls over to tomorrow
+        ("10:00", "11:00", time(11, 0), (23 * 3600, 3600, 3600)),
+        # Overnight ranges are anchored to today's start
+        ("23:00", "01:00", time(0, 30), (22 * 3600 + 1800, 7200, 7200)),
+        ("23:00", "01:00", time(23, 30), (0, 5400, 7200)),
+        # Equal start and end means a full day
+        ("9:00", "9:00", time(8, 0), (3600, 86400, 86400)),
+    ],
+)
+def test_calculate_from_range_boundaries(start, end, now, expected):
+    ref_now = datetime.combine(datetime(2024, 1, 1).date(), now)
+    assert calculate_from_range(start, end, now=ref_now) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("12am", time(0, 0)),
+        ("12pm", time(12, 0)),
+        ("12:45am", time(0, 45)),
+        ("7:5pm", time(19, 5)),
+        ("0:00", time(0, 0)),
+        ("23:59:59", time(23, 59, 59)),
+    ],
+)
+def test_parse_clock_time_edge_cases(text, expected):
+    from lock_me_out.utils.time import parse_clock_time
+
+    assert parse_clock_time(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["20", "0pm", "13pm", "24:00", "8:60", "8:30:15pm", "8:30:", "pm"]
+)
+def test_parse_clock_time_rejects(text):
+    from lock_me_out.utils.time import parse_clock_time
+
+    with pytest.raises(ValueError):
+        parse_clock_time(text)
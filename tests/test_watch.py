@@ -0,0 +1,29 @@
+import os
+import select
+import sys
+
+import pytest
+
+from lock_me_out.utils.watch import watch_directory
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+def test_watcher_reports_watched_names_only(tmp_path):
+    watcher = watch_directory(tmp_path, {"command.json"})
+    assert watcher is not None
+    try:
+        assert watcher.read() == set()
+
+        (tmp_path / "other.json").write_text("{}")
+        tmp = tmp_path / "command.tmp"
+        tmp.write_text("{}")
+        os.link(tmp, tmp_path / "command.json")
+
+        assert select.select([watcher], [], [], 2)[0] == [watcher]
+        assert watcher.read() == {"command.json"}
+        assert watcher.read() == set()
+    finally:
+        watcher.close()